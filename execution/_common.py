@@ -0,0 +1,46 @@
+# execution/_common.py
+import os
+from typing import Any, Dict, Optional
+
+TRUTHY = frozenset(("1", "true", "yes", "y", "on"))
+
+# modes that talk to an exchange (TESTNET trades fake money on the real API)
+LIVE_MODES = frozenset(("LIVE", "TESTNET"))
+
+# exact flag spellings seen in DB/env; anything else goes through strip/lower once
+_BOOL_MAP: Dict[Any, bool] = {s: True for s in TRUTHY}
+_BOOL_MAP.update({s.upper(): True for s in TRUTHY})
+_BOOL_MAP.update({s: False for s in ("0", "false", "no", "n", "off", "", "FALSE", "NO", "N", "OFF")})
+
+
+def to_bool01(v: Any) -> bool:
+    """DB / env flag -> bool: 1/0, True/False or "1"/"true"/"yes"/"y"/"on"."""
+    t = type(v)
+    if t is bool:
+        return v
+    if t is int:
+        return v != 0
+    if t is str:
+        hit = _BOOL_MAP.get(v)
+        if hit is not None:
+            return hit
+        return v.strip().lower() in TRUTHY
+    if v is None:
+        return False
+    if isinstance(v, (int, float)):  # float, numpy scalars, int subclasses
+        return int(v) != 0
+    return False
+
+
+def positive_float(x: Any) -> Optional[float]:
+    """Signal size field -> float > 0, or None when missing, unparsable or non-positive."""
+    try:
+        v = float(x) if x is not None else None
+    except (TypeError, ValueError):
+        return None
+    return v if v is not None and v > 0 else None
+
+
+def env_flag(name: str, default: str = "false") -> bool:
+    """Env flag, read once at import/construction time; same spellings as to_bool01."""
+    return to_bool01(os.getenv(name, default))
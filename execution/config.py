@@ -2,9 +2,7 @@
 import os
 from pathlib import Path
 
-
-def _env_bool(name: str, default: str = "false") -> bool:
-    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "y", "on")
+from execution._common import env_flag
 
 
 # რეჟიმი: DEMO | TESTNET | LIVE
@@ -13,10 +11,10 @@ if MODE not in ("DEMO", "TESTNET", "LIVE"):
     MODE = "DEMO"
 
 # LIVE/TESTNET-ზე დამატებითი დაცვა (დროებით იგივე gate ორივეზე)
-LIVE_CONFIRMATION = _env_bool("LIVE_CONFIRMATION", "false")
+LIVE_CONFIRMATION = env_flag("LIVE_CONFIRMATION", "false")
 
 # Startup sync gate
-STARTUP_SYNC_ENABLED = _env_bool("STARTUP_SYNC_ENABLED", "true")
+STARTUP_SYNC_ENABLED = env_flag("STARTUP_SYNC_ENABLED", "true")
 
 # DEMO ბალანსი
 VIRTUAL_START_BALANCE = float(os.getenv("VIRTUAL_START_BALANCE", "100000"))
@@ -26,7 +24,7 @@ BINANCE_API_KEY = os.getenv("BINANCE_API_KEY", "").strip()
 BINANCE_API_SECRET = os.getenv("BINANCE_API_SECRET", "").strip()
 
 # Kill switch (Render-ზე default TRUE უსაფრთხოდ)
-KILL_SWITCH = _env_bool("KILL_SWITCH", "true")
+KILL_SWITCH = env_flag("KILL_SWITCH", "true")
 
 # Persistent DB path (Render disk)
 DB_PATH = Path(os.getenv("DB_PATH", "/var/data/genius_bot.db"))
@@ -1,17 +1,103 @@
 # execution/db/db.py
 import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator
 from execution.config import DB_PATH
 
+_local = threading.local()
+
+
+def _configure(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """
+    Per-connection pragmas. With WAL, synchronous=NORMAL only fsyncs at
+    checkpoints instead of on every commit; a crash can lose the last few
+    commits but never corrupts the file. busy_timeout covers the write-queue
+    thread and the signal path contending for the write lock. Reads go through
+    a 128 MiB memory map and a 32 MiB page cache instead of read() copies.
+    """
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=134217728")
+    conn.execute("PRAGMA cache_size=-32768")
+    return conn
+
 
 def get_connection():
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    return sqlite3.connect(DB_PATH, check_same_thread=False)
+    return _configure(sqlite3.connect(DB_PATH, check_same_thread=False))
+
+
+def get_thread_connection() -> sqlite3.Connection:
+    """
+    One long-lived connection per thread. sqlite3 keeps compiled statements
+    per connection (cached_statements), so reusing it lets the repository's
+    fixed SQL skip re-parsing; a fresh connection per call always starts cold.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = _configure(sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=256))
+        _local.conn = conn
+    return conn
+
+
+def reset_thread_connection() -> None:
+    """Drop this thread's connection; the next get_thread_connection() opens a fresh one."""
+    conn = getattr(_local, "conn", None)
+    _local.conn = None
+    if conn is not None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
+def discard_if_broken(e: BaseException) -> None:
+    """
+    After a failed statement: constraint violations are the caller's business, any
+    other sqlite3 error (I/O, corrupt handle, closed connection) may have left the
+    long-lived connection unusable, so rebuild it on next use.
+    """
+    if isinstance(e, sqlite3.Error) and not isinstance(e, sqlite3.IntegrityError):
+        reset_thread_connection()
+
+
+@contextmanager
+def cursor() -> Iterator[sqlite3.Cursor]:
+    """
+    Cursor on this thread's pooled connection. Commits on success and rolls
+    back on error, so a failed write never leaves a transaction (and the
+    write lock) open on the long-lived connection.
+    """
+    conn = get_thread_connection()
+    cur = conn.cursor()
+    try:
+        yield cur
+        conn.commit()
+    except Exception as e:
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            pass
+        discard_if_broken(e)
+        raise
+    finally:
+        try:
+            cur.close()
+        except sqlite3.Error:
+            pass
 
 
 def init_db():
     conn = get_connection()
     cur = conn.cursor()
 
+    # journal mode is stored in the database file, so setting it once here is enough
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA wal_autocheckpoint=1000")
+
     # positions (legacy)
     cur.execute("""
     CREATE TABLE IF NOT EXISTS positions (
@@ -101,5 +187,15 @@ def init_db():
     )
     """)
 
+    # symbols are stored upper-case; normalize rows written before that
+    for table in ("oco_links", "trades", "executed_signals"):
+        cur.execute(f"UPDATE {table} SET symbol = UPPER(TRIM(symbol)) WHERE symbol != UPPER(TRIM(symbol))")
+
+    # per-symbol lookups on the signal path
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_positions_symbol_status ON positions(symbol, status)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_oco_links_symbol ON oco_links(symbol, status)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_oco_links_status ON oco_links(status, id)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_trades_symbol ON trades(symbol, closed_at)")
+
     conn.commit()
     conn.close()
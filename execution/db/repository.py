@@ -1,48 +1,62 @@
+import time
 import sqlite3
-from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
-from execution.db.db import get_connection
+from execution.db.db import cursor, discard_if_broken, get_thread_connection
+from execution.db.write_queue import enqueue_write
 
 
+# connections are per-thread and kept open so sqlite3's statement cache is reused;
+# a connection-level error drops it so the next call reconnects
 def _fetchone(query: str, params: Tuple = ()) -> Optional[Tuple]:
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute(query, params)
-    row = cur.fetchone()
-    conn.close()
-    return row
+    try:
+        return get_thread_connection().execute(query, params).fetchone()
+    except sqlite3.Error as e:
+        discard_if_broken(e)
+        raise
 
 
 def _fetchall(query: str, params: Tuple = ()) -> List[Tuple]:
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute(query, params)
-    rows = cur.fetchall()
-    conn.close()
-    return rows
+    try:
+        return get_thread_connection().execute(query, params).fetchall()
+    except sqlite3.Error as e:
+        discard_if_broken(e)
+        raise
 
 
 def _execute(query: str, params: Tuple = ()) -> None:
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute(query, params)
-    conn.commit()
-    conn.close()
+    with cursor() as cur:
+        cur.execute(query, params)
+
+
+def _sym(symbol: Any) -> str:
+    # symbols are stored upper-case so lookups hit the plain (symbol, ...) indexes
+    return str(symbol or "").strip().upper()
 
 
 # -----------------------
 # audit log
 # -----------------------
 def log_event(event_type: str, message: str) -> None:
-    _execute(
-        "INSERT INTO audit_log (event_type, message, created_at) VALUES (?, ?, datetime('now'))",
-        (str(event_type), str(message)),
+    # written behind by the queue; created_at is taken now (UTC, same format as datetime('now'))
+    enqueue_write(
+        "INSERT INTO audit_log (event_type, message, created_at) VALUES (?, ?, ?)",
+        (str(event_type), str(message), time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())),
     )
 
 
 # -----------------------
 # system state
 # -----------------------
+# bumped on every in-process update so readers holding a cached copy can tell it is stale
+_state_version = 0
+
+
+def system_state_version() -> int:
+    return _state_version
+
+
 def get_system_state():
     return _fetchone("SELECT * FROM system_state WHERE id = 1")
 
@@ -68,30 +82,134 @@ def update_system_state(status: Optional[str] = None, startup_sync_ok: Optional[
     q = "UPDATE system_state SET " + ", ".join(fields) + " WHERE id = 1"
     _execute(q, tuple(params))
 
+    global _state_version
+    _state_version += 1
+
 
 # -----------------------
 # executed signals
 # -----------------------
+# process-local LRU of ids known to be executed; executed ids never become
+# un-executed (only a released claim leaves it), so a hit can skip the DB round-trip
+_EXECUTED_LRU_SIZE = 4096
+_executed_ids: "OrderedDict[str, None]" = OrderedDict()
+
+
+def _remember_executed(signal_id: str) -> None:
+    _executed_ids[signal_id] = None
+    _executed_ids.move_to_end(signal_id)
+    if len(_executed_ids) > _EXECUTED_LRU_SIZE:
+        _executed_ids.popitem(last=False)
+
+
+def _seen(signal_id: str) -> bool:
+    if signal_id in _executed_ids:
+        _executed_ids.move_to_end(signal_id)
+        return True
+    return False
+
+
+def warm_executed_ids(limit: int = _EXECUTED_LRU_SIZE) -> int:
+    """Preload the most recently executed ids so restarts dedupe replays without a DB hit."""
+    rows = _fetchall(
+        "SELECT signal_id FROM executed_signals ORDER BY executed_at DESC LIMIT ?",
+        (int(limit),),
+    )
+    for (sid,) in reversed(rows):
+        _remember_executed(str(sid))
+    return len(rows)
+
+
 def signal_id_already_executed(signal_id: str) -> bool:
-    row = _fetchone("SELECT signal_id FROM executed_signals WHERE signal_id = ?", (str(signal_id),))
-    return row is not None
+    sid = str(signal_id)
+    if _seen(sid):
+        return True
+    row = _fetchone("SELECT 1 FROM executed_signals WHERE signal_id = ? LIMIT 1", (sid,))
+    if row is None:
+        return False
+    _remember_executed(sid)
+    return True
+
+
+# ids claimed by this process whose handler has not written a terminal action yet
+_pending_claims: set = set()
+
+
+def claim_signal_id(signal_id: str, signal_hash: Optional[str] = None, symbol: str = "") -> bool:
+    """
+    Atomic check-and-set: True if this call claimed the id, False if it was already
+    claimed/executed. The primary key makes it race-free across workers. The claim
+    ends either in mark_signal_id_executed() (CLAIMED row replaced by the real
+    action) or in release_signal_claim() (row removed, the id can run again).
+    """
+    sid = str(signal_id)
+    if _seen(sid):
+        return False
+    with cursor() as cur:
+        cur.execute(
+            "INSERT OR IGNORE INTO executed_signals (signal_id, signal_hash, action, symbol, executed_at) VALUES (?, ?, 'CLAIMED', ?, datetime('now'))",
+            (sid, str(signal_hash) if signal_hash else None, _sym(symbol)),
+        )
+        claimed = cur.rowcount == 1
+    if claimed:
+        _pending_claims.add(sid)
+    _remember_executed(sid)
+    return claimed
+
+
+def release_signal_claim(signal_id: str) -> bool:
+    """
+    Give back a claim that ended without a terminal action (blocked, exchange error
+    before any order, exception). True if a CLAIMED row was removed.
+    """
+    sid = str(signal_id)
+    if sid not in _pending_claims:
+        return False
+    _execute("DELETE FROM executed_signals WHERE signal_id = ? AND action = 'CLAIMED'", (sid,))
+    _pending_claims.discard(sid)
+    _executed_ids.pop(sid, None)
+    return True
 
 
 def mark_signal_id_executed(signal_id: str, signal_hash: Optional[str] = None, action: str = "", symbol: str = "") -> None:
+    sid = str(signal_id)
     _execute(
         "INSERT OR REPLACE INTO executed_signals (signal_id, signal_hash, action, symbol, executed_at) VALUES (?, ?, ?, ?, datetime('now'))",
-        (str(signal_id), str(signal_hash) if signal_hash else None, str(action), str(symbol)),
+        (sid, str(signal_hash) if signal_hash else None, str(action), _sym(symbol)),
     )
+    _pending_claims.discard(sid)
+    _remember_executed(sid)
 
 
 # -----------------------
 # OCO links
 # -----------------------
-def list_active_oco_links(limit: int = 50) -> List[Tuple]:
-    return _fetchall(
+class OcoLinkRow(NamedTuple):
+    link_id: int
+    signal_id: str
+    symbol: str
+    base_asset: str
+    tp_order_id: str
+    sl_order_id: str
+    tp_price: float
+    sl_stop_price: float
+    sl_limit_price: float
+    amount: float
+    status: str
+    created_at: str
+    updated_at: str
+
+
+_OCO_COLUMNS = """
+    id, signal_id, symbol, base_asset, tp_order_id, sl_order_id,
+    tp_price, sl_stop_price, sl_limit_price, amount, status, created_at, updated_at
+"""
+
+
+def list_active_oco_links(limit: int = 50) -> List[OcoLinkRow]:
+    rows = _fetchall(
         """
-        SELECT id, signal_id, symbol, base_asset, tp_order_id, sl_order_id,
-               tp_price, sl_stop_price, sl_limit_price, amount, status, created_at, updated_at
+        SELECT""" + _OCO_COLUMNS + """
         FROM oco_links
         WHERE status IN ('ACTIVE', 'OPEN', 'ARMED')
         ORDER BY id DESC
@@ -99,6 +217,22 @@ def list_active_oco_links(limit: int = 50) -> List[Tuple]:
         """,
         (int(limit),),
     )
+    return [OcoLinkRow._make(r) for r in rows]
+
+
+def list_active_oco_links_for_symbol(symbol: str, limit: int = 50) -> List[OcoLinkRow]:
+    rows = _fetchall(
+        """
+        SELECT""" + _OCO_COLUMNS + """
+        FROM oco_links
+        WHERE symbol = ?
+          AND status IN ('ACTIVE', 'OPEN', 'ARMED')
+        ORDER BY id DESC
+        LIMIT ?
+        """,
+        (_sym(symbol), int(limit)),
+    )
+    return [OcoLinkRow._make(r) for r in rows]
 
 
 def set_oco_status(link_id: int, status: str) -> None:
@@ -130,7 +264,7 @@ def create_oco_link(
         """,
         (
             str(signal_id),
-            str(symbol),
+            _sym(symbol),
             str(base_asset),
             str(tp_order_id),
             str(sl_order_id),
@@ -145,46 +279,80 @@ def create_oco_link(
 def has_active_oco_for_symbol(symbol: str) -> bool:
     row = _fetchone(
         """
-        SELECT id FROM oco_links
-        WHERE UPPER(symbol) = UPPER(?)
+        SELECT 1 FROM oco_links
+        WHERE symbol = ?
           AND status IN ('ACTIVE', 'OPEN', 'ARMED')
         LIMIT 1
         """,
-        (str(symbol),),
+        (_sym(symbol),),
     )
     return row is not None
 
 
+def get_symbol_exposure(symbol: str) -> Tuple[bool, bool]:
+    """(has_open_trade, has_active_oco) for a symbol in one round-trip."""
+    sym = _sym(symbol)
+    row = _fetchone(
+        """
+        SELECT
+            EXISTS(SELECT 1 FROM trades WHERE symbol = ? AND closed_at IS NULL),
+            EXISTS(SELECT 1 FROM oco_links WHERE symbol = ? AND status IN ('ACTIVE', 'OPEN', 'ARMED'))
+        """,
+        (sym, sym),
+    )
+    return bool(row[0]), bool(row[1])
+
+
 # -----------------------
 # trades
 # -----------------------
+class TradeRow(NamedTuple):
+    signal_id: str
+    symbol: str
+    qty: float
+    quote_in: float
+    entry_price: float
+    opened_at: str
+    exit_price: Optional[float]
+    closed_at: Optional[str]
+    outcome: Optional[str]
+    pnl_quote: Optional[float]
+    pnl_pct: Optional[float]
+
+
+_TRADE_COLUMNS = """
+    signal_id, symbol, qty, quote_in, entry_price, opened_at,
+    exit_price, closed_at, outcome, pnl_quote, pnl_pct
+"""
+
+
 def has_open_trade_for_symbol(symbol: str) -> bool:
     row = _fetchone(
         """
-        SELECT signal_id
+        SELECT 1
         FROM trades
-        WHERE UPPER(symbol) = UPPER(?)
+        WHERE symbol = ?
           AND closed_at IS NULL
         LIMIT 1
         """,
-        (str(symbol),),
+        (_sym(symbol),),
     )
     return row is not None
 
 
-def get_open_trade_for_symbol(symbol: str):
-    return _fetchone(
+def get_open_trade_for_symbol(symbol: str) -> Optional[TradeRow]:
+    row = _fetchone(
         """
-        SELECT signal_id, symbol, qty, quote_in, entry_price, opened_at,
-               exit_price, closed_at, outcome, pnl_quote, pnl_pct
+        SELECT""" + _TRADE_COLUMNS + """
         FROM trades
-        WHERE UPPER(symbol) = UPPER(?)
+        WHERE symbol = ?
           AND closed_at IS NULL
         ORDER BY opened_at DESC
         LIMIT 1
         """,
-        (str(symbol),),
+        (_sym(symbol),),
     )
+    return TradeRow._make(row) if row else None
 
 
 def open_trade(signal_id: str, symbol: str, qty: float, quote_in: float, entry_price: float) -> None:
@@ -196,20 +364,20 @@ def open_trade(signal_id: str, symbol: str, qty: float, quote_in: float, entry_p
         )
         VALUES (?, ?, ?, ?, ?, datetime('now'), NULL, NULL, NULL, NULL, NULL)
         """,
-        (str(signal_id), str(symbol), float(qty), float(quote_in), float(entry_price)),
+        (str(signal_id), _sym(symbol), float(qty), float(quote_in), float(entry_price)),
     )
 
 
-def get_trade(signal_id: str):
-    return _fetchone(
+def get_trade(signal_id: str) -> Optional[TradeRow]:
+    row = _fetchone(
         """
-        SELECT signal_id, symbol, qty, quote_in, entry_price, opened_at,
-               exit_price, closed_at, outcome, pnl_quote, pnl_pct
+        SELECT""" + _TRADE_COLUMNS + """
         FROM trades
         WHERE signal_id = ?
         """,
         (str(signal_id),),
     )
+    return TradeRow._make(row) if row else None
 
 
 def close_trade(signal_id: str, exit_price: float, outcome: str, pnl_quote: float, pnl_pct: float) -> None:
@@ -230,30 +398,13 @@ def close_trade(signal_id: str, exit_price: float, outcome: str, pnl_quote: floa
 def get_closed_trades() -> List[Dict[str, Any]]:
     rows = _fetchall(
         """
-        SELECT signal_id, symbol, qty, quote_in, entry_price, opened_at,
-               exit_price, closed_at, outcome, pnl_quote, pnl_pct
+        SELECT""" + _TRADE_COLUMNS + """
         FROM trades
         WHERE closed_at IS NOT NULL
         ORDER BY closed_at DESC
         """
     )
-
-    result: List[Dict[str, Any]] = []
-    for row in rows:
-        result.append({
-            "signal_id": row[0],
-            "symbol": row[1],
-            "qty": row[2],
-            "quote_in": row[3],
-            "entry_price": row[4],
-            "opened_at": row[5],
-            "exit_price": row[6],
-            "closed_at": row[7],
-            "outcome": row[8],
-            "pnl_quote": row[9],
-            "pnl_pct": row[10],
-        })
-    return result
+    return [TradeRow._make(row)._asdict() for row in rows]
 
 
 def get_trade_stats() -> Dict[str, Any]:
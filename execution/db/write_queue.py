@@ -0,0 +1,126 @@
+# execution/db/write_queue.py
+import os
+import time
+import queue
+import sqlite3
+import atexit
+import logging
+import threading
+from itertools import groupby
+from operator import itemgetter
+from typing import Tuple
+
+from execution.db.db import discard_if_broken, get_thread_connection
+
+logger = logging.getLogger("gbm")
+
+
+class WriteQueue:
+    """
+    Write-behind queue for append-only DB writes (audit log).
+    Callers enqueue (sql, params) and return immediately; one daemon thread
+    drains up to max_batch statements and commits them in a single transaction.
+    Trade / OCO / idempotency writes stay synchronous: the signal path reads them back.
+
+    The queue is bounded: if the writer falls behind, new entries are dropped
+    and counted instead of blocking the trading path. After the first entry the
+    writer lingers up to linger_sec so a burst of events shares one commit.
+    """
+
+    def __init__(self, max_batch: int = 256, max_size: int = 10_000, linger_sec: float = 0.01):
+        self.max_batch = max_batch
+        self.linger_sec = linger_sec
+        self.dropped = 0
+        # submit() runs on any caller thread, _write() on the writer: += is not atomic
+        self._dropped_lock = threading.Lock()
+        self._q: "queue.Queue[Tuple[str, Tuple]]" = queue.Queue(maxsize=max_size)
+        self._thread = threading.Thread(target=self._run, name="db-write-queue", daemon=True)
+        self._thread.start()
+
+    def submit(self, sql: str, params: Tuple = ()) -> None:
+        try:
+            self._q.put_nowait((sql, params))
+        except queue.Full:
+            dropped = self._count_dropped(1)
+            # log on 1, 2, 4, 8, ... drops so a stuck writer cannot flood the log too
+            if dropped & (dropped - 1) == 0:
+                logger.warning("DB_WRITE_QUEUE_FULL | dropped_total=%s", dropped)
+
+    def _count_dropped(self, n: int) -> int:
+        with self._dropped_lock:
+            self.dropped += n
+            return self.dropped
+
+    def _drain(self, first: Tuple[str, Tuple]) -> list:
+        batch = [first]
+        deadline = time.monotonic() + self.linger_sec
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(self._q.get(timeout=remaining))
+                else:
+                    batch.append(self._q.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch: list) -> None:
+        conn = None
+        try:
+            # inside the try: after discard_if_broken() this reconnects, and that can fail too
+            conn = get_thread_connection()
+            conn.execute("BEGIN IMMEDIATE")
+            # consecutive rows for the same statement go in one executemany
+            for sql, rows in groupby(batch, key=itemgetter(0)):
+                conn.executemany(sql, [params for _, params in rows])
+            conn.commit()
+        except Exception as e:
+            if conn is not None:
+                try:
+                    conn.rollback()
+                except sqlite3.Error:
+                    pass
+            discard_if_broken(e)
+            self._count_dropped(len(batch))
+            logger.warning("DB_WRITE_QUEUE_FAIL | dropped=%s err=%s", len(batch), e)
+
+    def _run(self) -> None:
+        # open the writer's connection up front so the first batch does not pay connect + pragmas
+        try:
+            get_thread_connection()
+        except sqlite3.Error as e:
+            logger.warning("DB_WRITE_QUEUE_WARM_FAIL | err=%s", e)
+        while True:
+            batch = self._drain(self._q.get())
+            try:
+                self._write(batch)
+            except Exception as e:
+                # this is the only writer: nothing may end the thread
+                logger.exception("DB_WRITE_QUEUE_ERROR | err=%s", e)
+            finally:
+                for _ in batch:
+                    self._q.task_done()
+
+    def join(self, timeout: float = 5.0) -> None:
+        """Wait (bounded) until everything enqueued so far is written."""
+        deadline = time.monotonic() + timeout
+        while self._q.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+
+_QUEUE = WriteQueue(
+    max_batch=max(1, int(os.getenv("DB_WRITE_BATCH", "256"))),
+    max_size=max(1, int(os.getenv("DB_WRITE_QUEUE_MAX", "10000"))),
+    linger_sec=max(0.0, float(os.getenv("DB_WRITE_LINGER_MS", "10")) / 1000.0),
+)
+atexit.register(_QUEUE.join)
+
+
+def enqueue_write(sql: str, params: Tuple = ()) -> None:
+    _QUEUE.submit(sql, params)
+
+
+def dropped_writes() -> int:
+    """Writes lost to a full queue or a failed batch since start."""
+    return _QUEUE.dropped
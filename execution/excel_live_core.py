@@ -8,6 +8,8 @@ from typing import Any, Dict, Tuple, Optional
 
 import openpyxl
 
+from execution._common import TRUTHY
+
 
 CORE_VERSION = "2026-02-20.soft-volume-override.v1"
 
@@ -52,7 +54,7 @@ def _env_bool(name: str, default: bool = False) -> bool:
     v = os.getenv(name)
     if v is None:
         return default
-    return str(v).strip().lower() in ("1", "true", "yes", "y", "on")
+    return str(v).strip().lower() in TRUTHY
 
 
 @dataclass
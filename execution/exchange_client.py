@@ -1,8 +1,18 @@
 import os
+import time
+import socket
 import logging
-from typing import Any, Dict, Optional
+import threading
+from decimal import Decimal
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 import ccxt
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+from execution._common import LIVE_MODES, env_flag
 
 logger = logging.getLogger("gbm")
 
@@ -15,65 +25,259 @@ class LiveTradingBlocked(Exception):
     pass
 
 
+def is_exchange_error(e: BaseException) -> bool:
+    """
+    True for ccxt network / exchange rejections (timeouts, rate limits, insufficient
+    funds, invalid orders), also when wrapped in ExchangeClientError. These are
+    expected at runtime: callers log them without a traceback.
+    """
+    while e is not None:
+        if isinstance(e, (ccxt.NetworkError, ccxt.ExchangeError)):
+            return True
+        e = e.__cause__
+    return False
+
+
+def is_filter_error(e: BaseException) -> bool:
+    """
+    True only for Binance filter rejections (-1013 "Filter failure: LOT_SIZE /
+    PRICE_FILTER / NOTIONAL ..."). Other ccxt.InvalidOrder subclasses such as
+    OrderNotFound or DuplicateOrderId say nothing about stale markets.
+    """
+    while e is not None:
+        if isinstance(e, ccxt.InvalidOrder):
+            msg = str(e)
+            if "-1013" in msg or "Filter failure" in msg:
+                return True
+        e = e.__cause__
+    return False
+
+
+TESTNET_REST_BASE = "https://testnet.binance.vision/api"
+
+class _TunedAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets have Nagle disabled (small signed REST requests)."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+
+_SESSION: Optional[requests.Session] = None
+
+
+def _tuned_session() -> requests.Session:
+    """
+    Process-wide HTTP session. All ccxt instances talk to the same one or two
+    Binance hosts, so sharing one keep-alive pool lets the price feed, signal
+    generator and spot client reuse each other's warm TLS connections.
+    """
+    global _SESSION
+    if _SESSION is None:
+        # ccxt does its own rate limiting and maps HTTP errors; the adapter only retries
+        # idempotent GETs on connection/read failures, never orders or HTTP status codes
+        retry = Retry(
+            total=2, connect=2, read=2, status=0,
+            backoff_factor=0.1,
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        # pool must cover the reconcile fan-out plus the signal path without blocking
+        pool_maxsize = max(1, int(os.getenv("HTTP_POOL_MAXSIZE", "32")))
+        session = requests.Session()
+        session.mount("https://", _TunedAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retry))
+        _SESSION = session
+    return _SESSION
+
+
+_SHARED_EXCHANGES: Dict[Tuple[bool, str, str], ccxt.binance] = {}
+
+
+def shared_binance(api_key: str = "", api_secret: str = "", testnet: bool = False, market_type: str = "spot") -> ccxt.binance:
+    """
+    One ccxt.binance instance per (network, api key, market type) for the whole process.
+    Price feed, signal generator and spot client share the HTTP session, rate limiter
+    and loaded markets instead of each building (and warming) their own.
+    """
+    key = (bool(testnet), api_key, market_type)
+    ex = _SHARED_EXCHANGES.get(key)
+    if ex is None:
+        ex = ccxt.binance({
+            "apiKey": api_key,
+            "secret": api_secret,
+            "enableRateLimit": True,
+            "options": {"defaultType": market_type},
+            "session": _tuned_session(),
+        })
+        if testnet:
+            ex.urls["api"] = {
+                "public": TESTNET_REST_BASE,
+                "private": TESTNET_REST_BASE,
+            }
+            ex.options["fetchCurrencies"] = False
+        _SHARED_EXCHANGES[key] = ex
+    return ex
+
+
+_SHARED_MARKETS: Dict[Tuple[bool, str], Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+
+
+def load_markets_once(exchange: ccxt.binance, testnet: bool = False, market_type: str = "spot") -> Dict[str, Any]:
+    """
+    Markets depend only on the network and market type, not on the API key.
+    The first instance downloads them; every other instance gets them via set_markets.
+    """
+    key = (bool(testnet), market_type)
+    shared = _SHARED_MARKETS.get(key)
+    if shared is None:
+        markets = exchange.load_markets()
+        _SHARED_MARKETS[key] = (markets, exchange.currencies)
+        return markets
+    if not exchange.markets:
+        exchange.set_markets(*shared)
+    return exchange.markets
+
+
+def _step_scale(step: Any) -> Tuple[int, int, int]:
+    """
+    Binance step string like '0.00001000' -> (scale, units, decimals) with
+    step == units / scale and scale a power of ten.
+    """
+    d = Decimal(str(step)).normalize()
+    decimals = max(0, -int(d.as_tuple().exponent))
+    scale = 10 ** decimals
+    return scale, int(d * scale), decimals
+
+
+def _floor_to_step(value: float, scale: int, units: int) -> float:
+    value = float(value)
+    n = int(value * scale)
+    # value * scale can land one unit off either way (0.00018 * 100000 ==
+    # 17.999999999999996; large amounts at scale 1e8 lose more than any fixed
+    # epsilon). n / scale is the float nearest the decimal n / scale, so
+    # comparing against value settles the boundary the way Decimal would.
+    if n / scale > value:
+        n -= 1
+    elif (n + 1) / scale <= value:
+        n += 1
+    if units != 1:
+        n -= n % units
+    return n / scale
+
+
+class SymbolParams(NamedTuple):
+    """
+    Exchange filters for one symbol, read in a single pass over the market.
+    Step fields are integer scales (value == units / scale); steps_known is
+    False when LOT_SIZE / PRICE_FILTER are missing and ccxt's helpers are used.
+    """
+    min_notional: float
+    steps_known: bool
+    amount_scale: int
+    amount_units: int
+    amount_decimals: int
+    price_scale: int
+    price_units: int
+    price_decimals: int
+
+
+_NO_STEPS = (False, 1, 1, 0, 1, 1, 0)
+
+
 class BinanceSpotClient:
-    TESTNET_REST_BASE = "https://testnet.binance.vision/api"
+    TESTNET_REST_BASE = TESTNET_REST_BASE
 
     def __init__(self):
         self.mode = os.getenv("MODE", "DEMO").upper()  # DEMO | TESTNET | LIVE
-        self.kill_switch = os.getenv("KILL_SWITCH", "false").lower() == "true"
-        self.live_confirmation = os.getenv("LIVE_CONFIRMATION", "false").lower() == "true"
+        self.kill_switch = env_flag("KILL_SWITCH")
+        self.live_confirmation = env_flag("LIVE_CONFIRMATION")
 
         self.max_quote_per_trade = float(os.getenv("MAX_QUOTE_PER_TRADE", "10"))
-        self.symbol_whitelist = set(
+        self.symbol_whitelist = frozenset(
             s.strip().upper()
             for s in os.getenv("SYMBOL_WHITELIST", "BTC/USDT").split(",")
             if s.strip()
         )
 
+        # env flags are fixed for the process: resolve the unconditional block once
+        self._block_reason: Optional[str] = None
+        if self.kill_switch:
+            self._block_reason = "KILL_SWITCH is ON."
+        elif self.mode == "LIVE" and not self.live_confirmation:
+            self._block_reason = "LIVE_CONFIRMATION is OFF."
+        elif self.mode == "DEMO":
+            self._block_reason = "MODE=DEMO -> exchange client must not execute real orders."
+
         api_key = os.getenv("BINANCE_API_KEY", "").strip()
         api_secret = os.getenv("BINANCE_API_SECRET", "").strip()
 
-        if self.mode in ("LIVE", "TESTNET"):
+        if self.mode in LIVE_MODES:
             if not api_key or not api_secret:
                 raise ExchangeClientError("Missing BINANCE_API_KEY / BINANCE_API_SECRET for LIVE/TESTNET.")
 
-        self.exchange = ccxt.binance({
-            "apiKey": api_key,
-            "secret": api_secret,
-            "enableRateLimit": True,
-            "options": {"defaultType": "spot"},
-        })
+        self.exchange = shared_binance(api_key, api_secret, testnet=(self.mode == "TESTNET"))
+
+        # bound ccxt methods used on the order path (skip attribute resolution per call)
+        self._fetch_ticker = self.exchange.fetch_ticker
+        self._fetch_balance = self.exchange.fetch_balance
+        self._fetch_order = self.exchange.fetch_order
+        self._fetch_open_orders = self.exchange.fetch_open_orders
+        self._fetch_orders = self.exchange.fetch_orders
+        self._cancel_order = self.exchange.cancel_order
+        self._create_order = self.exchange.create_order
+        self._amount_to_precision = self.exchange.amount_to_precision
+        self._price_to_precision = self.exchange.price_to_precision
+
+        # native OCO endpoint, resolved once (name differs between ccxt versions)
+        self._oco_method = (
+            getattr(self.exchange, "privatePostOrderOco", None)
+            or getattr(self.exchange, "private_post_order_oco", None)
+        )
+        if self._oco_method is None and self.mode in LIVE_MODES:
+            raise ExchangeClientError("ccxt.binance exposes no privatePostOrderOco endpoint; cannot place OCO exits.")
 
-        if self.mode == "TESTNET":
-            self.exchange.urls["api"] = {
-                "public": self.TESTNET_REST_BASE,
-                "private": self.TESTNET_REST_BASE,
-            }
-            self.exchange.options["fetchCurrencies"] = False
+        # per-symbol exchange filters; they do not change for the lifetime of the process
+        self._sym_cache: Dict[str, SymbolParams] = {}
+
+        # a burst of filter rejections must not turn into a burst of markets downloads
+        self.markets_reload_min_sec = float(os.getenv("MARKETS_RELOAD_MIN_SEC", "60"))
+        self._markets_reloaded_at: Optional[float] = None
 
-        # warm up markets for precision helpers
+        # warm up markets for precision helpers (downloaded once per network)
         try:
-            self.exchange.load_markets()
+            load_markets_once(self.exchange, testnet=(self.mode == "TESTNET"))
         except Exception as e:
-            logger.warning(f"LOAD_MARKETS_WARN | err={e}")
+            logger.warning("LOAD_MARKETS_WARN | err=%s", e)
+
+        # optional keep-alive: a cheap public call keeps the pooled TLS connection
+        # open across long signal cooldowns so the first order does not pay a handshake
+        self.keepalive_sec = float(os.getenv("EXCHANGE_KEEPALIVE_SEC", "0"))
+        if self.keepalive_sec > 0 and self.mode in LIVE_MODES:
+            threading.Thread(target=self._keepalive_loop, name="exchange-keepalive", daemon=True).start()
+
+    def _keepalive_loop(self) -> None:
+        while True:
+            time.sleep(self.keepalive_sec)
+            try:
+                self.exchange.fetch_time()
+            except Exception as e:
+                logger.warning("EXCHANGE_KEEPALIVE_WARN | err=%s", e)
 
     def _guard(self, symbol: str, quote_amount: Optional[float] = None) -> None:
-        if self.kill_switch:
-            raise LiveTradingBlocked("KILL_SWITCH is ON.")
-        if self.mode == "LIVE" and not self.live_confirmation:
-            raise LiveTradingBlocked("LIVE_CONFIRMATION is OFF.")
-        if self.mode == "DEMO":
-            raise LiveTradingBlocked("MODE=DEMO -> exchange client must not execute real orders.")
-        if symbol and symbol.upper() not in self.symbol_whitelist:
+        if self._block_reason is not None:
+            raise LiveTradingBlocked(self._block_reason)
+        if symbol and symbol not in self.symbol_whitelist and symbol.upper() not in self.symbol_whitelist:
             raise LiveTradingBlocked(f"Symbol not allowed by whitelist: {symbol}.")
         if quote_amount is not None and quote_amount > self.max_quote_per_trade:
             raise LiveTradingBlocked(f"quote_amount {quote_amount} exceeds MAX_QUOTE_PER_TRADE={self.max_quote_per_trade}")
 
     def diagnostics(self) -> Dict[str, Any]:
         try:
-            bal = self.exchange.fetch_balance()
+            bal = self._fetch_balance()
             sym = next(iter(self.symbol_whitelist)) if self.symbol_whitelist else "BTC/USDT"
-            t = self.exchange.fetch_ticker(sym)
+            t = self._fetch_ticker(sym)
             return {
                 "mode": self.mode,
                 "kill_switch": self.kill_switch,
@@ -84,82 +288,161 @@ class BinanceSpotClient:
                 "ok": True,
             }
         except Exception as e:
-            return {"ok": False, "error": str(e)}
+            # network blips / rate limits (ccxt.RateLimitExceeded is a NetworkError) are worth a retry
+            return {"ok": False, "error": str(e), "transient": isinstance(e, ccxt.NetworkError)}
+
+    def reload_markets(self) -> bool:
+        """
+        Re-download markets and drop the cached per-symbol filters, e.g. after an
+        order is rejected on a filter Binance has changed. The fresh set replaces
+        the shared copy, so clients created later on this network start from it.
+        At most one reload per MARKETS_RELOAD_MIN_SEC; returns False when skipped.
+        """
+        now = time.monotonic()
+        last = self._markets_reloaded_at
+        if last is not None and now - last < self.markets_reload_min_sec:
+            return False
+        self._markets_reloaded_at = now
+        markets = self.exchange.load_markets(reload=True)
+        _SHARED_MARKETS[(self.mode == "TESTNET", "spot")] = (markets, self.exchange.currencies)
+        self._sym_cache.clear()
+        return True
+
+    def _market(self, symbol: str) -> Dict[str, Any]:
+        # direct dict hit on the loaded markets; ccxt's market() only needed for id/alias lookups
+        m = (self.exchange.markets or {}).get(symbol)
+        if m is None:
+            m = self.exchange.market(symbol)
+        return m
 
     def fetch_last_price(self, symbol: str) -> float:
-        t = self.exchange.fetch_ticker(symbol)
+        t = self._fetch_ticker(symbol)
         return float(t["last"])
 
+    def _symbol_params(self, symbol: str) -> Optional[SymbolParams]:
+        """
+        Min notional plus LOT_SIZE / PRICE_FILTER steps from one walk over the
+        market's filters. Cached per symbol; None if the market cannot be resolved.
+        """
+        sp = self._sym_cache.get(symbol)
+        if sp is not None:
+            return sp
+
+        try:
+            m = self._market(symbol)
+        except Exception as e:
+            logger.warning("SYMBOL_PARAMS_LOOKUP_FAIL | symbol=%s err=%s", symbol, e)
+            return None
+
+        # ccxt normalized limits win over raw filters for min notional
+        min_notional = (((m.get("limits") or {}).get("cost") or {}).get("min"))
+
+        step = tick = raw_notional = None
+        for f in (m.get("info") or {}).get("filters") or []:
+            t = str(f.get("filterType") or "").upper()
+            if t == "LOT_SIZE":
+                step = f.get("stepSize")
+            elif t == "PRICE_FILTER":
+                tick = f.get("tickSize")
+            elif t in ("MIN_NOTIONAL", "NOTIONAL") and raw_notional is None:
+                raw_notional = f.get("minNotional")
+                if raw_notional is None:
+                    raw_notional = f.get("minNotionalValue")
+                if raw_notional is None:
+                    raw_notional = f.get("notional")
+
+        if min_notional is None:
+            min_notional = raw_notional
+
+        if step and tick and float(step) > 0 and float(tick) > 0:
+            steps = (True,) + _step_scale(step) + _step_scale(tick)
+        else:
+            steps = _NO_STEPS
+
+        sp = SymbolParams(float(min_notional or 0.0), *steps)
+        self._sym_cache[symbol] = sp
+        return sp
+
     def get_min_notional(self, symbol: str) -> float:
         """Return minimum notional (quote value) required for an order on this symbol.
 
         Binance may reject market orders if the quote value is below MIN_NOTIONAL/NOTIONAL filter.
         We try multiple sources (ccxt limits then raw exchange filters) and return 0.0 if unknown.
         """
-        try:
-            m = self.exchange.market(symbol)
-
-            # 1) ccxt normalized limits (if available)
-            cost_min = (((m.get("limits") or {}).get("cost") or {}).get("min"))
-            if cost_min is not None:
-                return float(cost_min)
-
-            # 2) raw Binance filters
-            info = m.get("info") or {}
-            filters = info.get("filters") or []
-            for f in filters:
-                t = str(f.get("filterType") or "").upper()
-                if t in ("MIN_NOTIONAL", "NOTIONAL"):
-                    v = f.get("minNotional")
-                    if v is None:
-                        v = f.get("minNotionalValue")
-                    if v is None:
-                        v = f.get("notional")
-                    if v is not None:
-                        return float(v)
-        except Exception as e:
-            logger.warning(f"MIN_NOTIONAL_LOOKUP_FAIL | symbol={symbol} err={e}")
-
-        return 0.0
+        sp = self._symbol_params(symbol)
+        return sp.min_notional if sp is not None else 0.0
 
     def fetch_balance_free(self, asset: str) -> float:
-        bal = self.exchange.fetch_balance()
+        bal = self._fetch_balance()
         return float((bal.get("free", {}) or {}).get(asset.upper(), 0.0) or 0.0)
 
     def fetch_order(self, order_id: str, symbol: str) -> Dict[str, Any]:
-        return self.exchange.fetch_order(str(order_id), symbol)
+        return self._fetch_order(str(order_id), symbol)
+
+    def fetch_open_orders(self, symbol: str) -> List[Dict[str, Any]]:
+        return self._fetch_open_orders(symbol)
+
+    def fetch_orders(self, symbol: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Most recent orders for a symbol, any status (Binance allOrders)."""
+        return self._fetch_orders(symbol, None, limit)
 
     def cancel_order(self, order_id: str, symbol: str) -> Dict[str, Any]:
-        return self.exchange.cancel_order(str(order_id), symbol)
+        return self._cancel_order(str(order_id), symbol)
 
     # ----------------------------
     # Precision helpers (STRING!)
     # ----------------------------
+    def _steps(self, symbol: str) -> Optional[SymbolParams]:
+        sp = self._symbol_params(symbol)
+        return sp if sp is not None and sp.steps_known else None
+
     def floor_amount(self, symbol: str, amount: float) -> float:
         """
-        Returns float but derived from amount_to_precision (string) to avoid float artifacts.
+        Floors amount to the symbol's LOT_SIZE step (cached), falling back to
+        amount_to_precision (string) when filters are unknown.
         """
+        st = self._steps(symbol)
+        if st is not None:
+            return _floor_to_step(amount, st.amount_scale, st.amount_units)
         try:
-            s = self.exchange.amount_to_precision(symbol, amount)  # string like "0.00018"
+            s = self._amount_to_precision(symbol, amount)  # string like "0.00018"
             return float(s)
         except Exception:
             return float(amount)
 
     def floor_price(self, symbol: str, price: float) -> float:
         """
-        Returns float but derived from price_to_precision (string) to avoid float artifacts.
+        Floors price to the symbol's PRICE_FILTER tick (cached), falling back to
+        price_to_precision (string) when filters are unknown.
         """
+        st = self._steps(symbol)
+        if st is not None:
+            return _floor_to_step(price, st.price_scale, st.price_units)
         try:
-            s = self.exchange.price_to_precision(symbol, price)  # string like "76253.90"
+            s = self._price_to_precision(symbol, price)  # string like "76253.90"
             return float(s)
         except Exception:
             return float(price)
 
+    def floor_prices(self, symbol: str, *prices: float) -> Tuple[float, ...]:
+        """floor_price for several prices of one symbol (TP / SL stop / SL limit) with one filter lookup."""
+        st = self._steps(symbol)
+        if st is not None:
+            scale, units = st.price_scale, st.price_units
+            return tuple(_floor_to_step(p, scale, units) for p in prices)
+        return tuple(self.floor_price(symbol, p) for p in prices)
+
     def _amount_str(self, symbol: str, amount: float) -> str:
-        return str(self.exchange.amount_to_precision(symbol, amount))
+        st = self._steps(symbol)
+        if st is not None:
+            return f"{_floor_to_step(amount, st.amount_scale, st.amount_units):.{st.amount_decimals}f}"
+        return str(self._amount_to_precision(symbol, amount))
 
     def _price_str(self, symbol: str, price: float) -> str:
-        return str(self.exchange.price_to_precision(symbol, price))
+        st = self._steps(symbol)
+        if st is not None:
+            return f"{_floor_to_step(price, st.price_scale, st.price_units):.{st.price_decimals}f}"
+        return str(self._price_to_precision(symbol, price))
 
     # ----------------------------
     # Orders
@@ -168,38 +451,38 @@ class BinanceSpotClient:
         self._guard(symbol, quote_amount=quote_amount)
         try:
             params = {"quoteOrderQty": float(quote_amount)}
-            return self.exchange.create_order(symbol, "market", "buy", None, None, params)
+            return self._create_order(symbol, "market", "buy", None, None, params)
         except Exception as e:
-            raise ExchangeClientError(f"Market buy failed: {e}")
+            raise ExchangeClientError(f"Market buy failed: {e}") from e
 
     def place_market_sell(self, symbol: str, base_amount: float) -> Dict[str, Any]:
         """Market sell by base amount."""
         self._guard(symbol)
         try:
-            amt = float(self.exchange.amount_to_precision(symbol, base_amount))
-            return self.exchange.create_order(symbol, "market", "sell", float(amt), None)
+            amt = self.floor_amount(symbol, base_amount)
+            return self._create_order(symbol, "market", "sell", float(amt), None)
         except Exception as e:
-            raise ExchangeClientError(f"Market sell failed: {e}")
+            raise ExchangeClientError(f"Market sell failed: {e}") from e
 
     def place_limit_sell_amount(self, symbol: str, base_amount: float, price: float) -> Dict[str, Any]:
         self._guard(symbol)
         try:
-            amt = float(self.exchange.amount_to_precision(symbol, base_amount))
-            px = float(self.exchange.price_to_precision(symbol, price))
-            return self.exchange.create_order(symbol, "limit", "sell", float(amt), float(px))
+            amt = self.floor_amount(symbol, base_amount)
+            px = self.floor_price(symbol, price)
+            return self._create_order(symbol, "limit", "sell", float(amt), float(px))
         except Exception as e:
-            raise ExchangeClientError(f"Limit sell failed: {e}")
+            raise ExchangeClientError(f"Limit sell failed: {e}") from e
 
     def place_stop_loss_limit_sell(self, symbol: str, base_amount: float, stop_price: float, limit_price: float) -> Dict[str, Any]:
         self._guard(symbol)
         try:
-            amt = float(self.exchange.amount_to_precision(symbol, base_amount))
-            stop_px = float(self.exchange.price_to_precision(symbol, stop_price))
-            limit_px = float(self.exchange.price_to_precision(symbol, limit_price))
+            amt = self.floor_amount(symbol, base_amount)
+            stop_px = self.floor_price(symbol, stop_price)
+            limit_px = self.floor_price(symbol, limit_price)
             params = {"stopPrice": stop_px, "timeInForce": "GTC"}
-            return self.exchange.create_order(symbol, "STOP_LOSS_LIMIT", "sell", float(amt), float(limit_px), params)
+            return self._create_order(symbol, "STOP_LOSS_LIMIT", "sell", float(amt), float(limit_px), params)
         except Exception as e:
-            raise ExchangeClientError(f"Stop-loss-limit sell failed: {e}")
+            raise ExchangeClientError(f"Stop-loss-limit sell failed: {e}") from e
 
     def place_oco_sell(self, symbol: str, base_amount: float, tp_price: float, sl_stop_price: float, sl_limit_price: float) -> Dict[str, Any]:
         """
@@ -214,7 +497,7 @@ class BinanceSpotClient:
             stop_limit_price = self._price_str(symbol, sl_limit_price)
 
             payload = {
-                "symbol": self.exchange.market_id(symbol),
+                "symbol": self._market(symbol)["id"],
                 "side": "SELL",
                 "quantity": qty,
                 "price": price,
@@ -223,8 +506,27 @@ class BinanceSpotClient:
                 "stopLimitTimeInForce": "GTC",
             }
 
-            # direct endpoint call (stable)
-            res = self.exchange.privatePostOrderOco(payload)
+            if self._oco_method is None:
+                raise ExchangeClientError("OCO endpoint unavailable")
+            res = self._oco_method(payload)
             return {"raw": res}
         except Exception as e:
-            raise ExchangeClientError(f"OCO sell failed: {e}")
+            raise ExchangeClientError(f"OCO sell failed: {e}") from e
+
+
+_CLIENTS: Dict[str, BinanceSpotClient] = {}
+
+
+def make_exchange_client(mode: Optional[str] = None) -> Optional[BinanceSpotClient]:
+    """
+    DEMO never sends orders, so it gets no client at all (no ccxt instance, no
+    markets download); callers treat None as "exchange not wired".
+    LIVE/TESTNET share one BinanceSpotClient per mode across the process.
+    """
+    mode = (mode or os.getenv("MODE", "DEMO")).upper()
+    if mode not in LIVE_MODES:
+        return None
+    client = _CLIENTS.get(mode)
+    if client is None:
+        client = _CLIENTS[mode] = BinanceSpotClient()
+    return client
@@ -1,21 +1,33 @@
 import os
+import sys
 import time
 import logging
-from typing import Any, Dict, Optional, Tuple
-
-import ccxt
-
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from execution._common import LIVE_MODES, env_flag, positive_float, to_bool01
+from execution.exchange_client import (
+    LiveTradingBlocked,
+    shared_binance,
+    make_exchange_client,
+    is_exchange_error,
+    is_filter_error,
+)
+from execution.price_stream import make_price_stream
 from execution.db.repository import (
     get_system_state,
+    system_state_version,
     log_event,
     list_active_oco_links,
+    list_active_oco_links_for_symbol,
     create_oco_link,
     set_oco_status,
-    update_system_state,
-    signal_id_already_executed,
+    claim_signal_id,
+    release_signal_claim,
     mark_signal_id_executed,
-    has_active_oco_for_symbol,
-    has_open_trade_for_symbol,
+    get_symbol_exposure,
+    warm_executed_ids,
     open_trade,
     get_trade,
     get_open_trade_for_symbol,
@@ -31,43 +43,185 @@ from execution.telegram_notifier import (
 
 logger = logging.getLogger("gbm")
 
+# order / system statuses compared on every reconcile pass and signal
+_CLOSED_STATUSES = frozenset({"closed", "filled"})
+_CANCELED_STATUSES = frozenset({"canceled", "cancelled", "expired", "rejected"})
+_RUNNABLE_STATES = frozenset({"ACTIVE", "RUNNING"})
 
-def _to_bool01(v: Any) -> bool:
-    if v is None:
-        return False
-    if isinstance(v, bool):
-        return v
-    if isinstance(v, (int, float)):
-        return int(v) != 0
-    if isinstance(v, str):
-        s = v.strip().lower()
-        return s in ("1", "true", "yes", "y", "on")
-    return False
+# OCO leg order types: take-profit vs stop-loss
+_TP_TYPES = frozenset({"LIMIT", "LIMIT_MAKER"})
+_SL_TYPES = frozenset({"STOP_LOSS", "STOP_LOSS_LIMIT"})
+
+# allOrders costs about five single-order lookups in request weight:
+# only worth it when a symbol has at least this many legs to resolve
+_BATCH_LOOKUP_MIN = 5
+_BATCH_LOOKUP_LIMIT = 500
 
 
+@lru_cache(maxsize=1024)
 def _norm(s: Any) -> str:
+    # order statuses / symbols: a handful of distinct strings
     return str(s or "").strip().lower()
 
 
-class ExecutionEngine:
-    def __init__(self):
-        self.mode = os.getenv("MODE", "DEMO").upper()
-        self.env_kill_switch = os.getenv("KILL_SWITCH", "false").lower() == "true"
-        self.live_confirmation = os.getenv("LIVE_CONFIRMATION", "false").lower() == "true"
+@lru_cache(maxsize=64)
+def _upper(s: str) -> str:
+    # verdicts / directions / order types: a few distinct strings per process
+    return s.upper()
 
-        self.price_feed = ccxt.binance({"enableRateLimit": True})
 
-        self.exchange = None
-        if self.mode in ("LIVE", "TESTNET"):
-            from execution.exchange_client import BinanceSpotClient
-            self.exchange = BinanceSpotClient()
+@lru_cache(maxsize=512)
+def _symbol_meta(symbol: str) -> Tuple[str, str]:
+    # "BTC/USDT" -> ("BTC", "USDT"); parsed once per traded symbol
+    base, _, quote = symbol.partition("/")
+    return base.upper(), quote.upper()
 
-        self.state_debug = os.getenv("STATE_DEBUG", "false").lower() == "true"
+
+def _oco_leg_ids(raw: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    (tp_order_id, sl_order_id) from a Binance OCO response. Reports carry the
+    leg types; the plain "orders" list usually does not, so it is only a fallback.
+    Stops as soon as both legs are bound.
+    """
+    tp_order_id = ""
+    sl_order_id = ""
+    for legs in (raw.get("orderReports"), raw.get("orders")):
+        for leg in legs or ():
+            oid = leg.get("orderId")
+            if not oid:
+                continue
+            typ = _upper(str(leg.get("type") or ""))
+            if not tp_order_id and typ in _TP_TYPES:
+                tp_order_id = str(oid)
+            elif not sl_order_id and typ in _SL_TYPES:
+                sl_order_id = str(oid)
+            if tp_order_id and sl_order_id:
+                return tp_order_id, sl_order_id
+    return tp_order_id, sl_order_id
+
+
+class ParsedSignal(NamedTuple):
+    """One-pass view of an incoming signal dict; gates and handlers read these fields."""
+    signal_id: str
+    verdict: str
+    certified: bool
+    symbol: str  # "" when missing
+    direction: str
+    entry_type: str
+    position_size: Optional[float]  # > 0 or None
+    quote_amount: Optional[float]  # > 0 or None
+    signal_hash: Optional[str]
+
+    @classmethod
+    def from_raw(cls, signal: Dict[str, Any]) -> "ParsedSignal":
+        execution = signal.get("execution") or {}
+        entry = execution.get("entry") or {}
+        return cls(
+            signal_id=str(signal.get("signal_id", "UNKNOWN")),
+            verdict=_upper(str(signal.get("final_verdict", ""))),
+            certified=signal.get("certified_signal") is True,
+            symbol=str(execution.get("symbol") or ""),
+            direction=_upper(str(execution.get("direction", ""))),
+            entry_type=_upper(str(entry.get("type", ""))),
+            position_size=positive_float(execution.get("position_size")),
+            quote_amount=positive_float(execution.get("quote_amount")),
+            signal_hash=signal.get("_fingerprint") or signal.get("signal_hash"),
+        )
+
+
+class SystemState(NamedTuple):
+    status: str  # upper-cased
+    startup_sync_ok: bool
+    kill_switch: bool
+
+
+# fallback when system_state has an unexpected shape
+_EMPTY_STATE = SystemState("", False, False)
+
+
+def _fill_price(order: Dict[str, Any]) -> float:
+    """
+    Executed price of a market order from the order response itself: average/price,
+    else cost/filled, else the VWAP of its fills (raw Binance "fills" or ccxt "trades").
+    0.0 if unknown.
+    """
+    v = float(order.get("average") or order.get("price") or 0.0)
+    if v > 0:
+        return v
+    filled = float(order.get("filled") or 0.0)
+    if filled > 0:
+        v = float(order.get("cost") or 0.0) / filled
+        if v > 0:
+            return v
+    fills = (order.get("info") or {}).get("fills") or order.get("trades") or ()
+    qty = 0.0
+    quote = 0.0
+    for f in fills:
+        q = float(f.get("qty") or f.get("amount") or 0.0)
+        qty += q
+        quote += q * float(f.get("price") or 0.0)
+    return quote / qty if qty > 0 else 0.0
+
+
+class ExecutionEngine:
+    # fixed attribute set: no per-instance __dict__, slot access on the hot path
+    __slots__ = (
+        "mode", "env_kill_switch", "live_confirmation",
+        "price_feed", "price_stream", "exchange", "state_debug",
+        "tp_pct", "sl_pct", "sl_limit_gap_pct",
+        "_tp_mul", "_sl_mul", "_sl_lim_mul",
+        "sell_buffer", "sell_retry_buffer",
+        "max_spread_pct", "estimated_roundtrip_fee_pct", "estimated_slippage_pct", "min_net_profit_pct",
+        "demo_ticker_ttl_sec", "_ticker_cache",
+        "entry_mode", "limit_entry_offset_pct", "limit_entry_timeout_sec",
+        "reconcile_workers", "_io_pool",
+        "state_ttl_sec", "_state_cache",
+        "_trade_impl", "_env_block", "_is_demo", "_is_live", "_is_exchange_mode",
+    )
+
+    def __init__(self):
+        self.mode = sys.intern(os.getenv("MODE", "DEMO").upper())
+        # mode tests on the signal path are attribute reads, not string compares
+        self._is_demo = self.mode == "DEMO"
+        self._is_live = self.mode == "LIVE"
+        self._is_exchange_mode = self.mode in LIVE_MODES
+        self.env_kill_switch = env_flag("KILL_SWITCH")
+        self.live_confirmation = env_flag("LIVE_CONFIRMATION")
+
+        # process-wide gates are fixed at start: fold them into one (flag, event) or None
+        self._env_block: Optional[Tuple[str, str]] = None
+        if self.env_kill_switch:
+            self._env_block = ("KILL_SWITCH=ON", "EXEC_BLOCKED_KILL_SWITCH")
+        elif self._is_live and not self.live_confirmation:
+            self._env_block = ("LIVE_CONFIRMATION=OFF", "EXEC_BLOCKED_LIVE_CONFIRMATION")
+
+        self.exchange = make_exchange_client(self.mode)
+
+        # LIVE/TESTNET read prices and order books from the trading client's own ccxt
+        # instance (the network it trades on); DEMO gets the shared public mainnet feed
+        if self.exchange is not None:
+            self.price_feed = self.exchange.exchange
+        else:
+            self.price_feed = shared_binance(
+                os.getenv("BINANCE_API_KEY", "").strip(),
+                os.getenv("BINANCE_API_SECRET", "").strip(),
+            )
+        # TRADE path picked once per process: DEMO never walks the LIVE branches
+        self._trade_impl = self._execute_demo if self._is_demo else self._execute_live
+        # opt-in (PRICE_STREAM=true): websocket tickers, REST stays the fallback
+        self.price_stream = make_price_stream()
+
+        self.state_debug = env_flag("STATE_DEBUG")
 
         self.tp_pct = float(os.getenv("TP_PCT", "1.30"))
         self.sl_pct = float(os.getenv("SL_PCT", "0.70"))
         self.sl_limit_gap_pct = float(os.getenv("SL_LIMIT_GAP_PCT", "0.15"))
 
+        # OCO price multipliers off the fill price
+        self._tp_mul = 1.0 + self.tp_pct / 100.0
+        self._sl_mul = 1.0 - self.sl_pct / 100.0
+        self._sl_lim_mul = 1.0 - self.sl_limit_gap_pct / 100.0
+
         self.sell_buffer = float(os.getenv("SELL_BUFFER", "0.999"))
         self.sell_retry_buffer = float(os.getenv("SELL_RETRY_BUFFER", "0.998"))
 
@@ -76,33 +230,86 @@ class ExecutionEngine:
         self.estimated_slippage_pct = float(os.getenv("ESTIMATED_SLIPPAGE_PCT", "0.15"))
         self.min_net_profit_pct = float(os.getenv("MIN_NET_PROFIT_PCT", "0.60"))
 
+        # DEMO fills price off a short-lived ticker cache instead of one HTTPS call per signal
+        self.demo_ticker_ttl_sec = float(os.getenv("DEMO_TICKER_TTL_SEC", "1.0"))
+        self._ticker_cache: Dict[str, Tuple[float, float]] = {}
+
+        # system_state changes rarely; re-read at most every STATE_TTL_MS or after an in-process update
+        self.state_ttl_sec = max(0.0, float(os.getenv("STATE_TTL_MS", "500")) / 1000.0)
+        self._state_cache: Optional[Tuple[float, int, SystemState]] = None
+
+        # reconcile fan-out: caps concurrent REST calls (Binance weight limits); pool created on first use
+        self.reconcile_workers = max(1, int(os.getenv("OCO_RECONCILE_WORKERS", "8")))
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+
         self.entry_mode = os.getenv("ENTRY_MODE", "MARKET").strip().upper()
         self.limit_entry_offset_pct = float(os.getenv("LIMIT_ENTRY_OFFSET_PCT", "0.02"))
         self.limit_entry_timeout_sec = int(os.getenv("LIMIT_ENTRY_TIMEOUT_SEC", "6"))
 
-    def _load_system_state(self) -> Dict[str, Any]:
+        # also opens this thread's pooled DB connection before the first signal
+        try:
+            warm_executed_ids()
+        except Exception as e:
+            logger.warning("EXECUTED_IDS_WARM_FAIL | err=%s", e)
+
+    def _load_system_state(self, force: bool = False) -> SystemState:
+        """
+        System state behind a short TTL (STATE_TTL_MS), invalidated by in-process
+        update_system_state(). force=True skips the cache: a kill switch flipped by
+        another process must stop a real-money order without waiting out the TTL.
+        """
+        now = time.monotonic()
+        version = system_state_version()
+        hit = self._state_cache
+        if not force and hit is not None and hit[1] == version and now - hit[0] < self.state_ttl_sec:
+            return hit[2]
+        state = self._read_system_state()
+        self._state_cache = (now, version, state)
+        return state
+
+    def _read_system_state(self) -> SystemState:
         raw = get_system_state()
-        if self.state_debug:
-            logger.info(f"SYSTEM_STATE_RAW | type={type(raw)} value={raw}")
+        if self.state_debug and logger.isEnabledFor(logging.INFO):
+            logger.info("SYSTEM_STATE_RAW | type=%s value=%s", type(raw), raw)
 
         if isinstance(raw, (list, tuple)):
+            # the system_state row itself: flags are INTEGER NOT NULL 0/1, no string forms to parse
             status = raw[1] if len(raw) > 1 else ""
-            sync = raw[2] if len(raw) > 2 else 0
-            kill = raw[3] if len(raw) > 3 else 0
-            return {
-                "status": str(status or "").upper(),
-                "startup_sync_ok": _to_bool01(sync),
-                "kill_switch": _to_bool01(kill),
-            }
+            return SystemState(
+                status=str(status or "").upper(),
+                startup_sync_ok=len(raw) > 2 and bool(raw[2]),
+                kill_switch=len(raw) > 3 and bool(raw[3]),
+            )
 
         if isinstance(raw, dict):
-            return {
-                "status": str(raw.get("status") or "").upper(),
-                "startup_sync_ok": _to_bool01(raw.get("startup_sync_ok")),
-                "kill_switch": _to_bool01(raw.get("kill_switch")),
-            }
+            return SystemState(
+                status=str(raw.get("status") or "").upper(),
+                startup_sync_ok=to_bool01(raw.get("startup_sync_ok")),
+                kill_switch=to_bool01(raw.get("kill_switch")),
+            )
 
-        return {"status": "", "startup_sync_ok": False, "kill_switch": False}
+        return _EMPTY_STATE
+
+    def _last_price(self, symbol: str) -> float:
+        if self.price_stream is not None:
+            streamed = self.price_stream.last(symbol)
+            if streamed:
+                return streamed
+        now = time.monotonic()
+        hit = self._ticker_cache.get(symbol)
+        if hit is not None and now - hit[0] < self.demo_ticker_ttl_sec:
+            return hit[1]
+        last = float(self.price_feed.fetch_ticker(symbol)["last"])
+        self._ticker_cache[symbol] = (now, last)
+        return last
+
+    def _exchange_last_price(self, symbol: str) -> float:
+        # the stream carries mainnet quotes; TESTNET prices must come from its own REST endpoint
+        if self.price_stream is not None and self._is_live:
+            streamed = self.price_stream.last(symbol)
+            if streamed:
+                return streamed
+        return self.exchange.fetch_last_price(symbol)
 
     def _get_spread_pct(self, symbol: str) -> Optional[float]:
         try:
@@ -118,7 +325,7 @@ class ExecutionEngine:
                 return None
             return ((ask - bid) / mid) * 100.0
         except Exception as e:
-            logger.warning(f"SPREAD_FETCH_FAIL | symbol={symbol} err={e}")
+            logger.warning("SPREAD_FETCH_FAIL | symbol=%s err=%s", symbol, e)
             return None
 
     def _net_edge_ok(self) -> Tuple[bool, str]:
@@ -155,8 +362,61 @@ class ExecutionEngine:
 
         return float(net_pnl_quote), float(net_pnl_pct)
 
+    def _pool(self) -> ThreadPoolExecutor:
+        # kept for the engine's lifetime: reconcile runs every cycle, no per-pass thread spin-up
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=self.reconcile_workers, thread_name_prefix="oco-io")
+        return self._io_pool
+
+    def _open_orders_by_id(self, symbols) -> Dict[str, Dict[str, Any]]:
+        pool = self._pool()
+        futs = {sym: pool.submit(self.exchange.fetch_open_orders, sym) for sym in symbols}
+        by_id: Dict[str, Dict[str, Any]] = {}
+        for sym, f in futs.items():
+            try:
+                for o in f.result():
+                    by_id[str(o.get("id"))] = o
+            except Exception as e:
+                logger.warning("OCO_RECONCILE_OPEN_ORDERS_FAIL | symbol=%s err=%s", sym, e)
+        return by_id
+
+    def _recent_orders_by_id(self, wanted) -> Dict[str, Dict[str, Any]]:
+        """
+        One allOrders call per symbol with enough unresolved legs; returns the wanted
+        ids found there. Legs older than the returned window stay missing.
+        """
+        by_sym: Dict[str, set] = {}
+        for oid, sym in wanted:
+            by_sym.setdefault(sym, set()).add(oid)
+        pool = self._pool()
+        futs = {
+            sym: pool.submit(self.exchange.fetch_orders, sym, _BATCH_LOOKUP_LIMIT)
+            for sym, ids in by_sym.items()
+            if len(ids) >= _BATCH_LOOKUP_MIN
+        }
+        found: Dict[str, Dict[str, Any]] = {}
+        for sym, f in futs.items():
+            try:
+                ids = by_sym[sym]
+                for o in f.result():
+                    oid = str(o.get("id"))
+                    if oid in ids:
+                        found[oid] = o
+            except Exception as e:
+                logger.warning("OCO_RECONCILE_ALL_ORDERS_FAIL | symbol=%s err=%s", sym, e)
+        return found
+
+    def _fetch_orders(self, wanted) -> Dict[str, Any]:
+        """
+        fetch_order for (order_id, symbol) pairs on the bounded pool; network-bound, so the
+        calls overlap instead of queueing. Values are the order dict or the raised exception.
+        """
+        pool = self._pool()
+        futs = {oid: pool.submit(self.exchange.fetch_order, oid, sym) for oid, sym in wanted}
+        return {oid: (f.exception() or f.result()) for oid, f in futs.items()}
+
     def reconcile_oco(self) -> None:
-        if self.mode not in ("LIVE", "TESTNET"):
+        if not self._is_exchange_mode:
             return
         if self.exchange is None:
             return
@@ -165,43 +425,63 @@ class ExecutionEngine:
         if not rows:
             return
 
-        CLOSED = {"closed", "filled"}
-        CANCELED = {"canceled", "cancelled", "expired", "rejected"}
+        CLOSED = _CLOSED_STATUSES
+        CANCELED = _CANCELED_STATUSES
+        # per-link loop: bind the log callables once instead of a global/attribute lookup per call
+        norm = _norm
+        audit = log_event
+        log_info = logger.info
+        log_warning = logger.warning
+        info_on = logger.isEnabledFor(logging.INFO)
+
+        # one open-orders call per symbol; legs missing from it (filled/canceled) come from one
+        # allOrders call per busy symbol, and only what is still unresolved is fetched by id
+        open_by_id = self._open_orders_by_id({r.symbol for r in rows})
+        missing = {
+            (str(oid), r.symbol)
+            for r in rows
+            for oid in (r.tp_order_id, r.sl_order_id)
+            if oid and str(oid) not in open_by_id
+        }
+        recent_by_id = self._recent_orders_by_id(missing)
+        fetched = self._fetch_orders({w for w in missing if w[0] not in recent_by_id})
+        orders = {**fetched, **recent_by_id, **open_by_id}
 
         for r in rows:
-            (
-                link_id, signal_id, symbol, base_asset,
-                tp_order_id, sl_order_id,
-                tp_price, sl_stop_price, sl_limit_price,
-                amount, status, created_at, updated_at
-            ) = r
+            link_id, signal_id, symbol = r.link_id, r.signal_id, r.symbol
+            tp_order_id, sl_order_id = r.tp_order_id, r.sl_order_id
 
             if not tp_order_id or not sl_order_id:
-                logger.warning(f"OCO_RECONCILE_SKIP | link={link_id} missing order ids tp='{tp_order_id}' sl='{sl_order_id}'")
+                log_warning("OCO_RECONCILE_SKIP | link=%s missing order ids tp='%s' sl='%s'", link_id, tp_order_id, sl_order_id)
                 continue
 
             try:
-                tp = self.exchange.fetch_order(tp_order_id, symbol)
-                sl = self.exchange.fetch_order(sl_order_id, symbol)
-
-                tp_status = _norm(tp.get("status"))
-                sl_status = _norm(sl.get("status"))
-
-                logger.info(
-                    f"OCO_RECONCILE | link={link_id} id={signal_id} symbol={symbol} "
-                    f"tp={tp_order_id}:{tp_status} sl={sl_order_id}:{sl_status}"
-                )
+                tp = orders[str(tp_order_id)]
+                sl = orders[str(sl_order_id)]
+                for o in (tp, sl):
+                    if isinstance(o, Exception):
+                        raise o
+
+                tp_status = norm(tp.get("status"))
+                sl_status = norm(sl.get("status"))
+
+                if info_on:
+                    log_info(
+                        "OCO_RECONCILE | link=%s id=%s symbol=%s "
+                        "tp=%s:%s sl=%s:%s",
+                        link_id, signal_id, symbol, tp_order_id, tp_status, sl_order_id, sl_status,
+                    )
 
                 if sl_status in CLOSED:
                     set_oco_status(link_id, "CLOSED_SL")
 
                     tr = get_trade(signal_id)
-                    exitp = self._exit_price_from_order(sl, fallback=float(sl_stop_price))
+                    exitp = self._exit_price_from_order(sl, fallback=float(r.sl_stop_price))
 
                     if tr:
-                        _, _, qty, quote_in, entry_price, *_ = tr
+                        entry_price = tr.entry_price
                         pnl_quote, pnl_pct = self._calc_net_pnl(
-                            float(quote_in), float(entry_price), float(exitp), float(qty)
+                            float(tr.quote_in), float(entry_price), float(exitp), float(tr.qty)
                         )
                         close_trade(
                             signal_id,
@@ -210,13 +490,14 @@ class ExecutionEngine:
                             pnl_quote=float(pnl_quote),
                             pnl_pct=float(pnl_pct),
                         )
-                        log_event(
+                        audit(
                             "TRADE_CLOSED",
                             f"{signal_id} {symbol} SL exit={exitp} net_pnl_quote={pnl_quote:.4f} net_pnl_pct={pnl_pct:.3f}"
                         )
-                        logger.info(
-                            f"TRADE_CLOSED | id={signal_id} symbol={symbol} outcome=SL "
-                            f"exit={exitp} net_pnl_quote={pnl_quote:.4f} net_pnl_pct={pnl_pct:.3f}"
+                        log_info(
+                            "TRADE_CLOSED | id=%s symbol=%s outcome=SL "
+                            "exit=%s net_pnl_quote=%.4f net_pnl_pct=%.3f",
+                            signal_id, symbol, exitp, pnl_quote, pnl_pct,
                         )
 
                         try:
@@ -231,24 +512,24 @@ class ExecutionEngine:
                                 stats=stats,
                             )
                         except Exception as e:
-                            logger.warning(f"TG_NOTIFY_CLOSE_FAIL | id={signal_id} outcome=SL err={e}")
+                            log_warning("TG_NOTIFY_CLOSE_FAIL | id=%s outcome=SL err=%s", signal_id, e)
                     else:
-                        log_event("TRADE_CLOSE_WARN", f"{signal_id} {symbol} SL filled but trade row missing")
-                        logger.warning(f"TRADE_CLOSE_WARN | id={signal_id} symbol={symbol} SL filled but trade missing")
+                        audit("TRADE_CLOSE_WARN", f"{signal_id} {symbol} SL filled but trade row missing")
+                        log_warning("TRADE_CLOSE_WARN | id=%s symbol=%s SL filled but trade missing", signal_id, symbol)
 
-                    log_event("OCO_CLOSED", f"{signal_id} SL_FILLED sl={sl_order_id} tp={tp_order_id} tp_status={tp_status}")
+                    audit("OCO_CLOSED", f"{signal_id} SL_FILLED sl={sl_order_id} tp={tp_order_id} tp_status={tp_status}")
                     continue
 
                 if tp_status in CLOSED:
                     set_oco_status(link_id, "CLOSED_TP")
 
                     tr = get_trade(signal_id)
-                    exitp = self._exit_price_from_order(tp, fallback=float(tp_price))
+                    exitp = self._exit_price_from_order(tp, fallback=float(r.tp_price))
 
                     if tr:
-                        _, _, qty, quote_in, entry_price, *_ = tr
+                        entry_price = tr.entry_price
                         pnl_quote, pnl_pct = self._calc_net_pnl(
-                            float(quote_in), float(entry_price), float(exitp), float(qty)
+                            float(tr.quote_in), float(entry_price), float(exitp), float(tr.qty)
                         )
                         close_trade(
                             signal_id,
@@ -257,13 +538,14 @@ class ExecutionEngine:
                             pnl_quote=float(pnl_quote),
                             pnl_pct=float(pnl_pct),
                         )
-                        log_event(
+                        audit(
                             "TRADE_CLOSED",
                             f"{signal_id} {symbol} TP exit={exitp} net_pnl_quote={pnl_quote:.4f} net_pnl_pct={pnl_pct:.3f}"
                         )
-                        logger.info(
-                            f"TRADE_CLOSED | id={signal_id} symbol={symbol} outcome=TP "
-                            f"exit={exitp} net_pnl_quote={pnl_quote:.4f} net_pnl_pct={pnl_pct:.3f}"
+                        log_info(
+                            "TRADE_CLOSED | id=%s symbol=%s outcome=TP "
+                            "exit=%s net_pnl_quote=%.4f net_pnl_pct=%.3f",
+                            signal_id, symbol, exitp, pnl_quote, pnl_pct,
                         )
 
                         try:
@@ -278,12 +560,12 @@ class ExecutionEngine:
                                 stats=stats,
                             )
                         except Exception as e:
-                            logger.warning(f"TG_NOTIFY_CLOSE_FAIL | id={signal_id} outcome=TP err={e}")
+                            log_warning("TG_NOTIFY_CLOSE_FAIL | id=%s outcome=TP err=%s", signal_id, e)
                     else:
-                        log_event("TRADE_CLOSE_WARN", f"{signal_id} {symbol} TP filled but trade row missing")
-                        logger.warning(f"TRADE_CLOSE_WARN | id={signal_id} symbol={symbol} TP filled but trade missing")
+                        audit("TRADE_CLOSE_WARN", f"{signal_id} {symbol} TP filled but trade row missing")
+                        log_warning("TRADE_CLOSE_WARN | id=%s symbol=%s TP filled but trade missing", signal_id, symbol)
 
-                    log_event("OCO_CLOSED", f"{signal_id} TP_FILLED tp={tp_order_id} sl={sl_order_id} sl_status={sl_status}")
+                    audit("OCO_CLOSED", f"{signal_id} TP_FILLED tp={tp_order_id} sl={sl_order_id} sl_status={sl_status}")
                     continue
 
                 if (tp_status in CANCELED and sl_status == "open") or (sl_status in CANCELED and tp_status == "open"):
@@ -291,39 +573,43 @@ class ExecutionEngine:
 
                 if tp_status in CANCELED and sl_status in CANCELED:
                     set_oco_status(link_id, "FAILED")
-                    log_event("OCO_FAILED", f"{signal_id} tp={tp_order_id}:{tp_status} sl={sl_order_id}:{sl_status}")
+                    audit("OCO_FAILED", f"{signal_id} tp={tp_order_id}:{tp_status} sl={sl_order_id}:{sl_status}")
                     continue
 
             except Exception as e:
-                logger.warning(f"OCO_RECONCILE_FAIL | link={link_id} symbol={symbol} err={e}")
+                log_warning("OCO_RECONCILE_FAIL | link=%s symbol=%s err=%s", link_id, symbol, e)
 
     def _execute_sell(self, signal_id: str, symbol: str, signal_hash: str = None) -> None:
-        logger.info(f"SELL_ENTER | id={signal_id} symbol={symbol} MODE={self.mode}")
+        logger.info("SELL_ENTER | id=%s symbol=%s MODE=%s", signal_id, symbol, self.mode)
 
-        if self.mode == "DEMO":
+        if self._is_demo:
             log_event("SELL_DEMO", f"{signal_id} DEMO SELL {symbol}")
-            mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="SELL_DEMO", symbol=str(symbol))
+            mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="SELL_DEMO", symbol=symbol)
             return
 
         if self.exchange is None:
             log_event("SELL_BLOCKED_NO_EXCHANGE", f"{signal_id} {symbol}")
-            logger.warning(f"SELL_BLOCKED | exchange client not wired | id={signal_id} symbol={symbol}")
+            logger.warning("SELL_BLOCKED | exchange client not wired | id=%s symbol=%s", signal_id, symbol)
             return
 
         if is_kill_switch_active():
-            logger.error(f"KILL_SWITCH_ACTIVE_LAST_GATE | SELL_BLOCKED | id={signal_id} symbol={symbol}")
+            logger.error("KILL_SWITCH_ACTIVE_LAST_GATE | SELL_BLOCKED | id=%s symbol=%s", signal_id, symbol)
             log_event("SELL_BLOCKED_KILL_SWITCH_LAST_GATE", f"{signal_id} {symbol}")
             return
 
-        rows = list_active_oco_links(limit=50)
-        rows = [r for r in rows if str(r[2] or "").upper() == str(symbol).upper()]
-        CLOSED = {"closed", "filled"}
+        rows = list_active_oco_links_for_symbol(symbol, limit=50)
+        CLOSED = _CLOSED_STATUSES
+
+        # every leg of every link fetched concurrently instead of two serial calls per link
+        legs = self._fetch_orders([(oid, symbol) for r in rows for oid in (r.tp_order_id, r.sl_order_id)]) if rows else {}
 
         for r in rows:
-            link_id, oco_signal_id, sym, base_asset, tp_order_id, sl_order_id, *_rest = r
+            link_id, tp_order_id, sl_order_id = r.link_id, r.tp_order_id, r.sl_order_id
             try:
-                tp = self.exchange.fetch_order(tp_order_id, symbol)
-                sl = self.exchange.fetch_order(sl_order_id, symbol)
+                tp, sl = legs[tp_order_id], legs[sl_order_id]
+                for leg in (tp, sl):
+                    if isinstance(leg, BaseException):
+                        raise leg
                 tp_status = _norm(tp.get("status"))
                 sl_status = _norm(sl.get("status"))
 
@@ -336,22 +622,26 @@ class ExecutionEngine:
                     log_event("SELL_SKIP", f"{signal_id} {symbol} already closed by SL (link={link_id})")
                     continue
 
-                for oid in (tp_order_id, sl_order_id):
-                    if not oid:
-                        continue
-                    try:
-                        self.exchange.cancel_order(str(oid), symbol)
-                    except Exception as e:
-                        logger.warning(f"SELL_CANCEL_WARN | id={signal_id} symbol={symbol} order_id={oid} err={e}")
+                # the two legs are independent orders: cancel them concurrently
+                pool = self._pool()
+                cancels = [
+                    (oid, pool.submit(self.exchange.cancel_order, str(oid), symbol))
+                    for oid in (tp_order_id, sl_order_id)
+                    if oid
+                ]
+                for oid, f in cancels:
+                    e = f.exception()
+                    if e is not None:
+                        logger.warning("SELL_CANCEL_WARN | id=%s symbol=%s order_id=%s err=%s", signal_id, symbol, oid, e)
 
                 set_oco_status(link_id, "CANCELED_BY_SIGNAL")
                 log_event("OCO_CANCELED", f"{signal_id} {symbol} link={link_id} canceled_by_signal")
 
             except Exception as e:
-                logger.warning(f"SELL_OCO_LOOKUP_FAIL | id={signal_id} symbol={symbol} link={link_id} err={e}")
+                logger.warning("SELL_OCO_LOOKUP_FAIL | id=%s symbol=%s link=%s err=%s", signal_id, symbol, link_id, e)
 
-        base_asset = symbol.split("/")[0].upper()
-        free_base = float(self.exchange.fetch_balance_free(base_asset))
+        base_asset, _quote = _symbol_meta(symbol)
+        free_base = self.exchange.fetch_balance_free(base_asset)
         sell_amount = self.exchange.floor_amount(symbol, free_base * self.sell_buffer)
         if sell_amount <= 0:
             sell_amount = self.exchange.floor_amount(symbol, free_base * self.sell_retry_buffer)
@@ -360,56 +650,61 @@ class ExecutionEngine:
             msg = f"SELL_SKIP_NO_FREE_BASE | id={signal_id} symbol={symbol} free_{base_asset}={free_base}"
             logger.warning(msg)
             log_event("SELL_SKIP_NO_FREE_BASE", msg)
-            mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="SELL_NO_FREE_BASE", symbol=str(symbol))
+            mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="SELL_NO_FREE_BASE", symbol=symbol)
             return
 
         try:
             sell = self.exchange.place_market_sell(symbol=symbol, base_amount=sell_amount)
-            avg = float(sell.get("average") or sell.get("price") or 0.0) or self.exchange.fetch_last_price(symbol)
+            avg = _fill_price(sell) or self._exchange_last_price(symbol)
 
-            logger.info(f"SELL_LIVE_OK | id={signal_id} symbol={symbol} amount={sell_amount} avg={avg} order_id={sell.get('id')}")
+            logger.info("SELL_LIVE_OK | id=%s symbol=%s amount=%s avg=%s order_id=%s", signal_id, symbol, sell_amount, avg, sell.get("id"))
             log_event("SELL_LIVE_OK", f"{signal_id} {symbol} amount={sell_amount} avg={avg} order_id={sell.get('id')}")
 
             tr = get_open_trade_for_symbol(symbol)
             if tr:
-                trade_signal_id, _, qty, quote_in, entry_price, *_ = tr
+                trade_signal_id, entry_price = tr.signal_id, tr.entry_price
                 pnl_quote, pnl_pct = self._calc_net_pnl(
-                    float(quote_in), float(entry_price), float(avg), float(qty)
+                    tr.quote_in, entry_price, avg, tr.qty
                 )
                 close_trade(
                     trade_signal_id,
-                    exit_price=float(avg),
+                    exit_price=avg,
                     outcome="MANUAL_SELL",
-                    pnl_quote=float(pnl_quote),
-                    pnl_pct=float(pnl_pct),
+                    pnl_quote=pnl_quote,
+                    pnl_pct=pnl_pct,
                 )
                 log_event(
                     "TRADE_CLOSED",
                     f"{trade_signal_id} {symbol} MANUAL_SELL exit={avg} net_pnl_quote={pnl_quote:.4f} net_pnl_pct={pnl_pct:.3f}"
                 )
                 logger.info(
-                    f"TRADE_CLOSED | id={trade_signal_id} symbol={symbol} outcome=MANUAL_SELL "
-                    f"exit={avg} net_pnl_quote={pnl_quote:.4f} net_pnl_pct={pnl_pct:.3f}"
+                    "TRADE_CLOSED | id=%s symbol=%s outcome=MANUAL_SELL "
+                    "exit=%s net_pnl_quote=%.4f net_pnl_pct=%.3f",
+                    trade_signal_id, symbol, avg, pnl_quote, pnl_pct,
                 )
 
                 try:
                     stats = get_trade_stats()
                     notify_trade_closed(
-                        symbol=str(symbol),
-                        entry_price=float(entry_price),
-                        exit_price=float(avg),
-                        pnl_quote=float(pnl_quote),
-                        pnl_pct=float(pnl_pct),
+                        symbol=symbol,
+                        entry_price=entry_price,
+                        exit_price=avg,
+                        pnl_quote=pnl_quote,
+                        pnl_pct=pnl_pct,
                         outcome="MANUAL_SELL",
                         stats=stats,
                     )
                 except Exception as e:
-                    logger.warning(f"TG_NOTIFY_CLOSE_FAIL | id={trade_signal_id} outcome=MANUAL_SELL err={e}")
+                    logger.warning("TG_NOTIFY_CLOSE_FAIL | id=%s outcome=MANUAL_SELL err=%s", trade_signal_id, e)
 
-            mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="SELL_LIVE", symbol=str(symbol))
+            mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="SELL_LIVE", symbol=symbol)
 
         except Exception as e:
-            logger.exception(f"SELL_LIVE_ERROR | id={signal_id} symbol={symbol} err={e}")
+            if is_exchange_error(e):
+                # known network/exchange failure: the message is enough, skip the traceback
+                logger.warning("SELL_LIVE_ERROR | id=%s symbol=%s err=%s", signal_id, symbol, e)
+            else:
+                logger.exception("SELL_LIVE_ERROR | id=%s symbol=%s err=%s", signal_id, symbol, e)
             log_event("SELL_LIVE_ERROR", f"{signal_id} {symbol} err={e}")
             return
 
@@ -422,120 +717,152 @@ class ExecutionEngine:
             raise RuntimeError(f"SPREAD_TOO_WIDE spread%={sp:.4f} > MAX_SPREAD_PCT={self.max_spread_pct:.4f}")
 
         buy = self.exchange.place_market_buy_by_quote(symbol=symbol, quote_amount=quote_amount)
-        buy_avg = float(buy.get("average") or buy.get("price") or 0.0) or self.exchange.fetch_last_price(symbol)
+        buy_avg = _fill_price(buy) or self._exchange_last_price(symbol)
         return buy, buy_avg
 
     def execute_signal(self, signal: Dict[str, Any]) -> None:
-        signal_id = str(signal.get("signal_id", "UNKNOWN"))
-        verdict = str(signal.get("final_verdict", "")).upper()
-
-        logger.info(f"EXEC_ENTER | id={signal_id} verdict={verdict} MODE={self.mode} ENV_KILL_SWITCH={self.env_kill_switch}")
+        p = ParsedSignal.from_raw(signal)
+        signal_id, verdict = p.signal_id, p.verdict
 
-        try:
-            if signal_id_already_executed(signal_id):
-                logger.warning(f"EXEC_DEDUPED | duplicate ignored | id={signal_id}")
-                log_event("EXEC_DEDUPED", f"id={signal_id}")
-                return
-        except Exception as e:
-            logger.error(f"EXEC_BLOCKED | idempotency_check_failed | id={signal_id} err={e}")
-            log_event("EXEC_BLOCKED_IDEMPOTENCY_FAIL", f"{signal_id} err={e}")
-            return
+        logger.info("EXEC_ENTER | id=%s verdict=%s MODE=%s ENV_KILL_SWITCH=%s", signal_id, verdict, self.mode, self.env_kill_switch)
 
-        state = self._load_system_state()
-        db_status = str(state.get("status") or "").upper()
-        db_kill = bool(state.get("kill_switch"))
-        sync_ok = bool(state.get("startup_sync_ok"))
-
-        if self.env_kill_switch or db_kill:
-            logger.warning(f"EXEC_BLOCKED | KILL_SWITCH=ON | id={signal_id}")
-            log_event("EXEC_BLOCKED_KILL_SWITCH", f"{signal_id}")
+        # cheap in-memory rejects first: process-wide flags, then the signal itself;
+        # DB work (system state, idempotency claim) only for signals that could execute
+        env_block = self._env_block
+        if env_block is not None:
+            logger.warning("EXEC_BLOCKED | %s | id=%s", env_block[0], signal_id)
+            log_event(env_block[1], f"{signal_id}")
             return
 
-        if not sync_ok or db_status not in ("ACTIVE", "RUNNING"):
-            logger.warning(f"EXEC_BLOCKED | system not ACTIVE/synced | id={signal_id} status={db_status} sync_ok={sync_ok}")
-            log_event("EXEC_BLOCKED_SYSTEM_STATE", f"{signal_id} status={db_status} sync_ok={sync_ok}")
+        if not p.certified:
+            log_event("REJECT_NOT_CERTIFIED", f"{signal_id}")
             return
 
-        if self.mode == "LIVE" and not self.live_confirmation:
-            logger.warning(f"EXEC_BLOCKED | LIVE_CONFIRMATION=OFF | id={signal_id}")
-            log_event("EXEC_BLOCKED_LIVE_CONFIRMATION", f"{signal_id}")
+        handler = self._VERDICT_HANDLERS.get(verdict)
+        if handler is None:
+            logger.warning("EXEC_REJECT | unsupported verdict | id=%s verdict=%s", signal_id, verdict)
+            log_event("REJECT_UNSUPPORTED_VERDICT", f"{signal_id} verdict={verdict}")
             return
 
-        if signal.get("certified_signal") is not True:
-            log_event("REJECT_NOT_CERTIFIED", f"{signal_id}")
+        bad_payload = self._payload_reject(p)
+        if bad_payload is not None:
+            logger.warning(
+                "EXEC_REJECT | bad %s payload | id=%s symbol=%s dir=%s entry=%s",
+                verdict, signal_id, p.symbol, p.direction, p.entry_type,
+            )
+            log_event(bad_payload, f"{signal_id} symbol={p.symbol} dir={p.direction} entry={p.entry_type}")
             return
 
-        execution = signal.get("execution") or {}
-        symbol = execution.get("symbol")
-        direction = str(execution.get("direction", "")).upper()
-        entry = execution.get("entry") or {}
-        entry_type = str(entry.get("type", "")).upper()
-
-        position_size = execution.get("position_size")
-        quote_amount = execution.get("quote_amount")
-
-        if verdict == "SELL":
-            if not symbol or direction != "LONG":
-                logger.warning(f"EXEC_REJECT | bad SELL payload | id={signal_id} symbol={symbol} dir={direction}")
-                log_event("REJECT_BAD_SELL_PAYLOAD", f"{signal_id} symbol={symbol} dir={direction}")
-                return
+        state = self._load_system_state(force=self._is_live)
+        db_status, sync_ok = state.status, state.startup_sync_ok
 
-            signal_hash = signal.get("_fingerprint") or signal.get("signal_hash")
-            self._execute_sell(signal_id=signal_id, symbol=str(symbol), signal_hash=signal_hash)
+        if state.kill_switch:
+            logger.warning("EXEC_BLOCKED | KILL_SWITCH=ON | id=%s", signal_id)
+            log_event("EXEC_BLOCKED_KILL_SWITCH", f"{signal_id}")
             return
 
-        if not symbol or direction != "LONG" or entry_type != "MARKET":
-            logger.warning(f"EXEC_REJECT | bad payload | id={signal_id} symbol={symbol} dir={direction} entry={entry_type}")
-            log_event("REJECT_BAD_PAYLOAD", f"{signal_id}")
+        if not sync_ok or db_status not in _RUNNABLE_STATES:
+            logger.warning("EXEC_BLOCKED | system not ACTIVE/synced | id=%s status=%s sync_ok=%s", signal_id, db_status, sync_ok)
+            log_event("EXEC_BLOCKED_SYSTEM_STATE", f"{signal_id} status={db_status} sync_ok={sync_ok}")
             return
 
-        signal_hash = signal.get("_fingerprint") or signal.get("signal_hash")
-
-        if self.mode == "DEMO":
-            last_price = float(self.price_feed.fetch_ticker(symbol)["last"])
-            base_size = float(position_size) if position_size is not None else float(quote_amount) / float(last_price)
-            resp = simulate_market_entry(symbol=symbol, side=direction, size=base_size, price=last_price)
-
-            log_event("TRADE_EXECUTED", f"{signal_id} DEMO {symbol} size={base_size} price={last_price}")
-            logger.info(f"EXEC_DEMO_OK | id={signal_id} resp={resp}")
-
-            mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="TRADE_DEMO", symbol=str(symbol))
+        # claim last: signals rejected by the gates above are never claimed
+        try:
+            if not claim_signal_id(signal_id, signal_hash=p.signal_hash, symbol=p.symbol):
+                logger.warning("EXEC_DEDUPED | duplicate ignored | id=%s", signal_id)
+                log_event("EXEC_DEDUPED", f"id={signal_id}")
+                return
+        except Exception as e:
+            logger.error("EXEC_BLOCKED | idempotency_check_failed | id=%s err=%s", signal_id, e)
+            log_event("EXEC_BLOCKED_IDEMPOTENCY_FAIL", f"{signal_id} err={e}")
             return
 
+        try:
+            handler(self, p)
+        finally:
+            # handler exits without a terminal mark_signal_id_executed() (last-gate blocks,
+            # exchange errors before an order, exceptions) release the claim so the id can rerun
+            try:
+                if release_signal_claim(signal_id):
+                    logger.info("EXEC_CLAIM_RELEASED | id=%s", signal_id)
+            except Exception as e:
+                logger.warning("EXEC_CLAIM_RELEASE_FAIL | id=%s err=%s", signal_id, e)
+
+    @staticmethod
+    def _payload_reject(p: ParsedSignal) -> Optional[str]:
+        """Shape check per verdict; returns the reject event to log, None if the payload is usable."""
+        if p.verdict == "HOLD":
+            return None
+        if not p.symbol or p.direction != "LONG":
+            return "REJECT_BAD_SELL_PAYLOAD" if p.verdict == "SELL" else "REJECT_BAD_PAYLOAD"
+        if p.verdict == "TRADE" and (
+            p.entry_type != "MARKET" or (p.position_size is None and p.quote_amount is None)
+        ):
+            return "REJECT_BAD_PAYLOAD"
+        return None
+
+    def _handle_hold(self, p: ParsedSignal) -> None:
+        log_event("EXEC_HOLD", f"{p.signal_id}")
+        mark_signal_id_executed(p.signal_id, signal_hash=p.signal_hash, action="HOLD", symbol=p.symbol)
+
+    def _handle_sell(self, p: ParsedSignal) -> None:
+        # payload shape already checked by _payload_reject
+        self._execute_sell(signal_id=p.signal_id, symbol=p.symbol, signal_hash=p.signal_hash)
+
+    def _handle_trade(self, p: ParsedSignal) -> None:
+        # payload shape already checked by _payload_reject (LONG / MARKET entry)
+        self._trade_impl(p)
+
+    def _execute_demo(self, p: ParsedSignal) -> None:
+        signal_id, symbol, position_size, quote_amount, signal_hash = (
+            p.signal_id, p.symbol, p.position_size, p.quote_amount, p.signal_hash,
+        )
+        last_price = self._last_price(symbol)
+        base_size = position_size if position_size is not None else quote_amount / last_price
+        resp = simulate_market_entry(symbol=symbol, side="LONG", size=base_size, price=last_price)
+
+        log_event("TRADE_EXECUTED", f"{signal_id} DEMO {symbol} size={base_size} price={last_price}")
+        logger.info("EXEC_DEMO_OK | id=%s resp=%s", signal_id, resp)
+
+        mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="TRADE_DEMO", symbol=symbol)
+
+    def _execute_live(self, p: ParsedSignal) -> None:
+        # ParsedSignal sizes and floor_*/_last_price/_place_entry_buy are already floats; no re-casting below
+        signal_id, symbol, position_size, quote_amount, signal_hash = (
+            p.signal_id, p.symbol, p.position_size, p.quote_amount, p.signal_hash,
+        )
         if self.exchange is None:
             log_event("EXEC_BLOCKED_NO_EXCHANGE", f"{signal_id}")
-            logger.warning(f"EXEC_BLOCKED | exchange client not wired | id={signal_id}")
+            logger.warning("EXEC_BLOCKED | exchange client not wired | id=%s", signal_id)
             return
 
-        from execution.exchange_client import LiveTradingBlocked
-
         try:
             ok_edge, edge_reason = self._net_edge_ok()
             if not ok_edge:
                 msg = f"EXEC_REJECT | EDGE_GATE | id={signal_id} symbol={symbol} {edge_reason}"
                 logger.warning(msg)
                 log_event("EXEC_REJECT_EDGE_GATE", msg)
-                mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="REJECT_EDGE_GATE", symbol=str(symbol))
+                mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="REJECT_EDGE_GATE", symbol=symbol)
                 return
 
             if quote_amount is None:
-                last = self.exchange.fetch_last_price(symbol)
-                quote_amount = float(position_size) * float(last)
-            quote_amount = float(quote_amount)
+                last = self._exchange_last_price(symbol)
+                quote_amount = position_size * last
 
             try:
-                if has_open_trade_for_symbol(str(symbol)):
+                has_open, has_oco = get_symbol_exposure(symbol)
+                if has_open:
                     msg = f"EXEC_REJECT | OPEN_TRADE_RACE | id={signal_id} symbol={symbol}"
                     logger.warning(msg)
                     log_event("EXEC_REJECT_OPEN_TRADE_RACE", msg)
-                    mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="REJECT_OPEN_TRADE_RACE", symbol=str(symbol))
+                    mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="REJECT_OPEN_TRADE_RACE", symbol=symbol)
                     return
 
-                if has_active_oco_for_symbol(str(symbol)):
+                if has_oco:
                     msg = f"EXEC_REJECT | ACTIVE_OCO_RACE | id={signal_id} symbol={symbol}"
                     logger.warning(msg)
                     log_event("EXEC_REJECT_ACTIVE_OCO_RACE", msg)
-                    mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="REJECT_ACTIVE_OCO_RACE", symbol=str(symbol))
+                    mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="REJECT_ACTIVE_OCO_RACE", symbol=symbol)
                     return
             except Exception as e:
                 msg = f"EXEC_BLOCKED | TRADE_STATE_CHECK_FAIL | id={signal_id} symbol={symbol} err={e}"
@@ -553,23 +880,23 @@ class ExecutionEngine:
                 msg = f"EXEC_REJECT | MIN_NOTIONAL | id={signal_id} symbol={symbol} quote={quote_amount:.8f} < min_notional={min_notional}"
                 logger.warning(msg)
                 log_event("EXEC_REJECT_MIN_NOTIONAL", msg)
-                mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="REJECT_MIN_NOTIONAL", symbol=str(symbol))
+                mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="REJECT_MIN_NOTIONAL", symbol=symbol)
                 return
 
             if is_kill_switch_active():
-                logger.error(f"KILL_SWITCH_ACTIVE_LAST_GATE | BUY_BLOCKED | id={signal_id}")
+                logger.error("KILL_SWITCH_ACTIVE_LAST_GATE | BUY_BLOCKED | id=%s", signal_id)
                 log_event("EXEC_BLOCKED_KILL_SWITCH_LAST_GATE", f"{signal_id} BUY_BLOCKED")
                 return
 
-            buy, buy_avg = self._place_entry_buy(symbol=str(symbol), quote_amount=quote_amount)
+            buy, buy_avg = self._place_entry_buy(symbol=symbol, quote_amount=quote_amount)
 
-            logger.info(f"EXEC_LIVE_BUY_OK | id={signal_id} symbol={symbol} quote={quote_amount} avg={buy_avg} order_id={buy.get('id')}")
+            logger.info("EXEC_LIVE_BUY_OK | id=%s symbol=%s quote=%s avg=%s order_id=%s", signal_id, symbol, quote_amount, buy_avg, buy.get("id"))
             log_event("TRADE_EXECUTED", f"{signal_id} LIVE BUY {symbol} quote={quote_amount} avg={buy_avg} order_id={buy.get('id')}")
 
-            mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="TRADE_LIVE_BUY", symbol=str(symbol))
+            mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="TRADE_LIVE_BUY", symbol=symbol)
 
-            base_asset = symbol.split("/")[0].upper()
-            free_base = float(self.exchange.fetch_balance_free(base_asset))
+            base_asset, _quote = _symbol_meta(symbol)
+            free_base = self.exchange.fetch_balance_free(base_asset)
 
             sell_amount = self.exchange.floor_amount(symbol, free_base * self.sell_buffer)
             if sell_amount <= 0:
@@ -583,88 +910,81 @@ class ExecutionEngine:
 
             open_trade(
                 signal_id=signal_id,
-                symbol=str(symbol),
-                qty=float(sell_amount),
-                quote_in=float(quote_amount),
-                entry_price=float(buy_avg),
+                symbol=symbol,
+                qty=sell_amount,
+                quote_in=quote_amount,
+                entry_price=buy_avg,
             )
 
-            tp_price = float(buy_avg) * (1.0 + self.tp_pct / 100.0)
-            sl_stop = float(buy_avg) * (1.0 - self.sl_pct / 100.0)
-            sl_limit = sl_stop * (1.0 - self.sl_limit_gap_pct / 100.0)
-
-            tp_price = self.exchange.floor_price(symbol, tp_price)
-            sl_stop = self.exchange.floor_price(symbol, sl_stop)
-            sl_limit = self.exchange.floor_price(symbol, sl_limit)
+            sl_stop_raw = buy_avg * self._sl_mul
+            tp_price, sl_stop, sl_limit = self.exchange.floor_prices(
+                symbol, buy_avg * self._tp_mul, sl_stop_raw, sl_stop_raw * self._sl_lim_mul,
+            )
 
             oco = self.exchange.place_oco_sell(
-                symbol=str(symbol),
-                base_amount=float(sell_amount),
-                tp_price=float(tp_price),
-                sl_stop_price=float(sl_stop),
-                sl_limit_price=float(sl_limit),
+                symbol=symbol,
+                base_amount=sell_amount,
+                tp_price=tp_price,
+                sl_stop_price=sl_stop,
+                sl_limit_price=sl_limit,
             )
 
             raw = oco.get("raw") or {}
-            orders = raw.get("orders") or []
             list_order_id = str(raw.get("orderListId") or "")
-
-            tp_order_id = ""
-            sl_order_id = ""
-
-            for x in orders:
-                oid = str(x.get("orderId") or "")
-                typ = str(x.get("type") or "").upper()
-                if typ == "LIMIT_MAKER":
-                    tp_order_id = oid
-                elif typ == "STOP_LOSS_LIMIT":
-                    sl_order_id = oid
-
-            if not tp_order_id or not sl_order_id:
-                reports = raw.get("orderReports") or []
-                for rep in reports:
-                    oid = str(rep.get("orderId") or "")
-                    typ = str(rep.get("type") or "").upper()
-                    if typ == "LIMIT_MAKER" and not tp_order_id:
-                        tp_order_id = oid
-                    elif typ == "STOP_LOSS_LIMIT" and not sl_order_id:
-                        sl_order_id = oid
+            tp_order_id, sl_order_id = _oco_leg_ids(raw)
 
             create_oco_link(
                 signal_id=signal_id,
-                symbol=str(symbol),
+                symbol=symbol,
                 base_asset=base_asset,
-                tp_order_id=str(tp_order_id),
-                sl_order_id=str(sl_order_id),
-                tp_price=float(tp_price),
-                sl_stop_price=float(sl_stop),
-                sl_limit_price=float(sl_limit),
-                amount=float(sell_amount),
+                tp_order_id=tp_order_id,
+                sl_order_id=sl_order_id,
+                tp_price=tp_price,
+                sl_stop_price=sl_stop,
+                sl_limit_price=sl_limit,
+                amount=sell_amount,
             )
 
             log_event("TRADE_LIVE_ARMED", f"{signal_id} {symbol} OCO_ARMED listOrderId={list_order_id}")
 
             try:
                 notify_signal_created(
-                    symbol=str(symbol),
-                    entry_price=float(buy_avg),
-                    quote_amount=float(quote_amount),
-                    tp_price=float(tp_price),
-                    sl_price=float(sl_stop),
+                    symbol=symbol,
+                    entry_price=buy_avg,
+                    quote_amount=quote_amount,
+                    tp_price=tp_price,
+                    sl_price=sl_stop,
                     verdict="BUY",
                     mode=self.mode,
                 )
             except Exception as e:
-                logger.warning(f"TG_NOTIFY_SIGNAL_FAIL | id={signal_id} err={e}")
+                logger.warning("TG_NOTIFY_SIGNAL_FAIL | id=%s err=%s", signal_id, e)
 
         except LiveTradingBlocked as e:
             msg = f"EXEC_REJECT | LIVE_BLOCKED | id={signal_id} reason={e}"
             logger.warning(msg)
             log_event("EXEC_REJECT_LIVE_BLOCKED", msg)
-            mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="REJECT_LIVE_BLOCKED", symbol=str(symbol))
+            mark_signal_id_executed(signal_id, signal_hash=signal_hash, action="REJECT_LIVE_BLOCKED", symbol=symbol)
             return
 
         except Exception as e:
-            logger.exception(f"EXEC_LIVE_ERROR | id={signal_id} err={e}")
+            if is_exchange_error(e):
+                # known network/exchange failure: the message is enough, skip the traceback
+                logger.warning("EXEC_LIVE_ERROR | id=%s err=%s", signal_id, e)
+            else:
+                logger.exception("EXEC_LIVE_ERROR | id=%s err=%s", signal_id, e)
             log_event("EXEC_LIVE_ERROR", f"{signal_id} err={e}")
+            if is_filter_error(e):
+                # filters may have changed on Binance: size the next order off fresh markets
+                try:
+                    self.exchange.reload_markets()
+                except Exception as reload_err:
+                    logger.warning("MARKETS_RELOAD_FAIL | err=%s", reload_err)
             return
+
+    # verdict -> handler; anything else is rejected in execute_signal
+    _VERDICT_HANDLERS = {
+        "TRADE": _handle_trade,
+        "SELL": _handle_sell,
+        "HOLD": _handle_hold,
+    }
@@ -1,8 +1,12 @@
 import os
 import time
+import queue
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional, Dict, Any
 
+from execution._common import env_flag
 from execution.db.db import init_db
 from execution.db.repository import (
     get_system_state,
@@ -34,11 +38,11 @@ def _bootstrap_state_if_needed() -> None:
     startup_sync_ok = int(raw[2] or 0)
     kill_switch_db = int(raw[3] or 0)
 
-    env_kill = os.getenv("KILL_SWITCH", "false").lower() == "true"
+    env_kill = env_flag("KILL_SWITCH")
 
     logger.info(
-        f"BOOTSTRAP_STATE | status={status} startup_sync_ok={startup_sync_ok} "
-        f"kill_db={kill_switch_db} env_kill={env_kill}"
+        "BOOTSTRAP_STATE | status=%s startup_sync_ok=%s kill_db=%s env_kill=%s",
+        status, startup_sync_ok, kill_switch_db, env_kill,
     )
 
     if env_kill or kill_switch_db == 1:
@@ -55,7 +59,7 @@ def _try_import_generator():
         from execution.signal_generator import run_once as generate_once
         return generate_once
     except Exception as e:
-        logger.error(f"GENERATOR_IMPORT_FAIL | err={e} -> generator disabled (consumer will still run)")
+        logger.error("GENERATOR_IMPORT_FAIL | err=%s -> generator disabled (consumer will still run)", e)
         try:
             log_event("GENERATOR_IMPORT_FAIL", f"err={e}")
         except Exception:
@@ -67,7 +71,7 @@ def _safe_pop_next_signal(outbox_path: str) -> Optional[Dict[str, Any]]:
     try:
         return pop_next_signal(outbox_path)
     except Exception as e:
-        logger.exception(f"OUTBOX_POP_FAIL | path={outbox_path} err={e}")
+        logger.exception("OUTBOX_POP_FAIL | path=%s err=%s", outbox_path, e)
         try:
             log_event("OUTBOX_POP_FAIL", f"path={outbox_path} err={e}")
         except Exception:
@@ -109,18 +113,35 @@ def _run_performance_report_safe(send_telegram: bool = False) -> None:
             try:
                 notify_performance_snapshot(s)
             except Exception as e:
-                logger.warning(f"TG_NOTIFY_PERF_FAIL | err={e}")
+                logger.warning("TG_NOTIFY_PERF_FAIL | err=%s", e)
 
     except Exception as e:
-        logger.warning(f"PERF_REPORT_FAIL | err={e}")
+        logger.warning("PERF_REPORT_FAIL | err=%s", e)
+
+
+def _setup_logging() -> None:
+    """
+    Root logging through a QueueHandler: one listener thread writes to the stream,
+    so a slow stdout pipe never stalls the signal path.
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("[%(levelname)s] %(asctime)s - %(message)s"))
+    q: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(q, handler, respect_handler_level=True)
+    # the queue side only merges msg % args; the listener's handler applies the real format
+    logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[QueueHandler(q)])
+    listener.start()
+    atexit.register(listener.stop)
 
 
 def main():
-    logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(asctime)s - %(message)s')
+    _setup_logging()
 
     mode = os.getenv("MODE", "DEMO").upper()
     outbox_path = os.getenv("SIGNAL_OUTBOX_PATH", "/var/data/signal_outbox.json")
     sleep_s = float(os.getenv("LOOP_SLEEP_SECONDS", "10"))
+    # signals executed per loop pass; a backlog drains without a sleep between signals
+    drain_max = max(1, int(os.getenv("OUTBOX_DRAIN_MAX", "20")))
 
     report_every_s = int(os.getenv("REPORT_EVERY_SECONDS", "60"))
     telegram_report_every_s = int(os.getenv("TELEGRAM_REPORT_EVERY_SECONDS", "1800"))
@@ -137,15 +158,16 @@ def main():
     try:
         engine.reconcile_oco()
     except Exception as e:
-        logger.warning(f"OCO_RECONCILE_START_WARN | err={e}")
+        logger.warning("OCO_RECONCILE_START_WARN | err=%s", e)
 
     generate_once = _try_import_generator()
 
-    logger.info(f"GENIUS BOT MAN worker starting | MODE={mode}")
-    logger.info(f"OUTBOX_PATH={outbox_path}")
-    logger.info(f"LOOP_SLEEP_SECONDS={sleep_s}")
-    logger.info(f"REPORT_EVERY_SECONDS={report_every_s}")
-    logger.info(f"TELEGRAM_REPORT_EVERY_SECONDS={telegram_report_every_s}")
+    logger.info("GENIUS BOT MAN worker starting | MODE=%s", mode)
+    logger.info("OUTBOX_PATH=%s", outbox_path)
+    logger.info("LOOP_SLEEP_SECONDS=%s", sleep_s)
+    logger.info("OUTBOX_DRAIN_MAX=%s", drain_max)
+    logger.info("REPORT_EVERY_SECONDS=%s", report_every_s)
+    logger.info("TELEGRAM_REPORT_EVERY_SECONDS=%s", telegram_report_every_s)
 
     while True:
         try:
@@ -161,7 +183,7 @@ def main():
             try:
                 engine.reconcile_oco()
             except Exception as e:
-                logger.warning(f"OCO_RECONCILE_LOOP_WARN | err={e}")
+                logger.warning("OCO_RECONCILE_LOOP_WARN | err=%s", e)
 
             if generate_once is not None:
                 try:
@@ -169,17 +191,21 @@ def main():
                     if created:
                         logger.info("SIGNAL_GENERATOR | signal created")
                 except Exception as e:
-                    logger.exception(f"SIGNAL_GENERATOR_FAIL | err={e}")
+                    logger.exception("SIGNAL_GENERATOR_FAIL | err=%s", e)
                     try:
                         log_event("SIGNAL_GENERATOR_FAIL", f"err={e}")
                     except Exception:
                         pass
 
-            sig = _safe_pop_next_signal(outbox_path)
-            if sig:
-                logger.info(f"Signal received | id={sig.get('signal_id')} | verdict={sig.get('final_verdict')}")
+            handled = 0
+            while handled < drain_max:
+                sig = _safe_pop_next_signal(outbox_path)
+                if not sig:
+                    break
+                logger.info("Signal received | id=%s | verdict=%s", sig.get("signal_id"), sig.get("final_verdict"))
                 engine.execute_signal(sig)
-            else:
+                handled += 1
+            if not handled:
                 logger.info("Worker alive, waiting for SIGNAL_OUTBOX...")
 
             now = time.time()
@@ -229,10 +255,10 @@ def main():
                         pass
 
             except Exception as e:
-                logger.warning(f"DAILY_SUMMARY_FAIL | err={e}")
+                logger.warning("DAILY_SUMMARY_FAIL | err=%s", e)
 
         except Exception as e:
-            logger.exception(f"WORKER_LOOP_ERROR | err={e}")
+            logger.exception("WORKER_LOOP_ERROR | err=%s", e)
             try:
                 log_event("WORKER_LOOP_ERROR", f"err={e}")
             except Exception:
@@ -0,0 +1,99 @@
+# execution/price_stream.py
+import os
+import time
+import asyncio
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from execution._common import env_flag
+
+logger = logging.getLogger("gbm")
+
+
+def _stream_symbols() -> List[str]:
+    raw = os.getenv("PRICE_STREAM_SYMBOLS", "").strip() or os.getenv("BOT_SYMBOLS", "").strip()
+    return [s.strip().upper() for s in raw.split(",") if s.strip()]
+
+
+class PriceStream:
+    """
+    Push price cache: one ccxt.pro watch_tickers subscription on a daemon
+    thread keeps {symbol: (monotonic_ts, last)} current, so a price lookup
+    is a dict read instead of a REST round-trip.
+
+    last() returns None for unknown symbols or quotes older than max_age_sec
+    (stream down / reconnecting); callers fall back to REST then.
+    """
+
+    def __init__(self, symbols: List[str], max_age_sec: float = 5.0):
+        self.symbols = list(symbols)
+        self.max_age_sec = max_age_sec
+        self._prices: Dict[str, Tuple[float, float]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "PriceStream":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="price-stream", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def last(self, symbol: str) -> Optional[float]:
+        hit = self._prices.get(symbol)
+        if hit is None or time.monotonic() - hit[0] > self.max_age_sec:
+            return None
+        return hit[1]
+
+    def _run(self) -> None:
+        asyncio.run(self._watch())
+
+    async def _watch(self) -> None:
+        import ccxt.pro as ccxtpro
+
+        ex = ccxtpro.binance({"enableRateLimit": True})
+        backoff = 1.0
+        try:
+            while not self._stop.is_set():
+                try:
+                    tickers = await ex.watch_tickers(self.symbols)
+                    now = time.monotonic()
+                    for sym, t in tickers.items():
+                        last = t.get("last")
+                        if last:
+                            # single dict assignment: atomic for readers on other threads
+                            self._prices[sym] = (now, float(last))
+                    backoff = 1.0
+                except Exception as e:
+                    logger.warning("PRICE_STREAM_ERROR | err=%s retry_in=%.0fs", e, backoff)
+                    await asyncio.sleep(backoff)
+                    backoff = min(backoff * 2, 30.0)
+        finally:
+            await ex.close()
+
+
+_STREAM: Optional[PriceStream] = None
+_STREAM_LOCK = threading.Lock()
+
+
+def make_price_stream() -> Optional[PriceStream]:
+    """
+    Opt-in via PRICE_STREAM=true; None when disabled or no symbols are configured.
+    One stream per process: every caller shares the same subscription and cache.
+    """
+    global _STREAM
+    if not env_flag("PRICE_STREAM"):
+        return None
+    with _STREAM_LOCK:
+        if _STREAM is None:
+            symbols = _stream_symbols()
+            if not symbols:
+                logger.warning("PRICE_STREAM_DISABLED | no PRICE_STREAM_SYMBOLS / BOT_SYMBOLS configured")
+                return None
+            max_age = float(os.getenv("PRICE_STREAM_MAX_AGE_SEC", "5"))
+            logger.info("PRICE_STREAM_START | symbols=%s max_age=%ss", ",".join(symbols), max_age)
+            _STREAM = PriceStream(symbols, max_age_sec=max_age).start()
+        return _STREAM
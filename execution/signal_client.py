@@ -3,9 +3,12 @@ import json
 import os
 import hashlib
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from tempfile import NamedTemporaryFile
 
+from execution._common import positive_float
+
 logger = logging.getLogger("gbm")
 
 
@@ -31,7 +34,12 @@ def _fingerprint(signal: Dict[str, Any]) -> str:
     entry_type = str((execution.get("entry") or {}).get("type") or "").upper().strip()
     pos_size = _safe_float(execution.get("position_size"))
 
-    base = f"v1:{verdict}:{symbol}:{direction}:{entry_type}:{pos_size}"
+    return _digest(f"v1:{verdict}:{symbol}:{direction}:{entry_type}:{pos_size}")
+
+
+@lru_cache(maxsize=1024)
+def _digest(base: str) -> str:
+    # few distinct (verdict, symbol, size) combos -> repeated fingerprints hit the cache
     return hashlib.sha256(base.encode("utf-8")).hexdigest()
 
 
@@ -66,9 +74,7 @@ def validate_signal(signal: Dict[str, Any]) -> None:
         if entry_type != "MARKET":
             raise ValueError("INVALID_ENTRY_TYPE")
 
-        ps = _safe_float(execution.get("position_size"))
-        qa = _safe_float(execution.get("quote_amount"))
-        if (ps is None or ps <= 0) and (qa is None or qa <= 0):
+        if positive_float(execution.get("position_size")) is None and positive_float(execution.get("quote_amount")) is None:
             raise ValueError("INVALID_POSITION_SIZE")
 
 
@@ -97,7 +103,29 @@ def _atomic_write_json(path: str, data: Dict[str, Any]) -> None:
     os.replace(tmp, path)
 
 
+def _normalize_signal(signal: Dict[str, Any]) -> None:
+    """
+    Canonical form at ingestion: verdict / symbol / direction / entry type
+    stripped and upper-cased in place, so the outbox holds the exact strings
+    the engine compares against.
+    """
+    if not isinstance(signal, dict):
+        return
+    if signal.get("final_verdict") is not None:
+        signal["final_verdict"] = str(signal["final_verdict"]).strip().upper()
+    execution = signal.get("execution")
+    if not isinstance(execution, dict):
+        return
+    for key in ("symbol", "direction"):
+        if execution.get(key) is not None:
+            execution[key] = str(execution[key]).strip().upper()
+    entry = execution.get("entry")
+    if isinstance(entry, dict) and entry.get("type") is not None:
+        entry["type"] = str(entry["type"]).strip().upper()
+
+
 def append_signal(signal: Dict[str, Any], outbox_path: str) -> None:
+    _normalize_signal(signal)
     validate_signal(signal)
 
     fp = _fingerprint(signal)
@@ -108,7 +136,7 @@ def append_signal(signal: Dict[str, Any], outbox_path: str) -> None:
 
     # soft dedupe in outbox (DB dedupe is the real safety net)
     if any((s.get("_fingerprint") == fp) for s in signals[-50:]):
-        logger.info(f"OUTBOX_DEDUPED | fingerprint={fp}")
+        logger.info("OUTBOX_DEDUPED | fingerprint=%s", fp)
         return
 
     signals.append(signal)
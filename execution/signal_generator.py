@@ -3,13 +3,16 @@ import os
 import time
 import uuid
 import logging
-from datetime import datetime
-from typing import Optional, Dict, Any, Tuple, List
+import itertools
+from collections import deque
+from typing import Optional, Dict, Any, Tuple, List, Deque, NamedTuple
 
 import ccxt
 
+from execution._common import env_flag
 from execution.signal_client import append_signal
-from execution.db.repository import has_active_oco_for_symbol, has_open_trade_for_symbol
+from execution.exchange_client import shared_binance
+from execution.db.repository import get_symbol_exposure
 from execution.excel_live_core import ExcelLiveCore, CoreInputs
 
 logger = logging.getLogger("gbm")
@@ -21,7 +24,7 @@ TIMEFRAME = os.getenv("BOT_TIMEFRAME", "15m").strip()
 CANDLE_LIMIT = int(os.getenv("BOT_CANDLE_LIMIT", "80"))
 COOLDOWN_SECONDS = int(os.getenv("BOT_SIGNAL_COOLDOWN_SECONDS", "180"))
 
-ALLOW_LIVE_SIGNALS = os.getenv("ALLOW_LIVE_SIGNALS", "false").strip().lower() == "true"
+ALLOW_LIVE_SIGNALS = env_flag("ALLOW_LIVE_SIGNALS", "false")
 
 BOT_QUOTE_PER_TRADE = float(os.getenv("BOT_QUOTE_PER_TRADE", "15"))
 
@@ -36,19 +39,19 @@ MIN_NET_PROFIT_PCT = float(os.getenv("MIN_NET_PROFIT_PCT", "0.60"))
 ATR_TO_TP_SANITY_FACTOR = float(os.getenv("ATR_TO_TP_SANITY_FACTOR", "0.20"))
 
 # Optional MA filters
-USE_MA_FILTERS = os.getenv("USE_MA_FILTERS", "true").strip().lower() == "true"
+USE_MA_FILTERS = env_flag("USE_MA_FILTERS", "true")
 MA_GAP_PCT = float(os.getenv("MA_GAP_PCT", "0.15"))
 
 # Extra confidence guard (after Excel decision)
 BUY_CONFIDENCE_MIN = float(os.getenv("BUY_CONFIDENCE_MIN", "0.64"))
 
-BLOCK_SIGNALS_WHEN_ACTIVE_OCO = os.getenv("BLOCK_SIGNALS_WHEN_ACTIVE_OCO", "true").strip().lower() == "true"
+BLOCK_SIGNALS_WHEN_ACTIVE_OCO = env_flag("BLOCK_SIGNALS_WHEN_ACTIVE_OCO", "true")
 
-GEN_DEBUG = os.getenv("GEN_DEBUG", "true").strip().lower() == "true"
-GEN_LOG_EVERY_TICK = os.getenv("GEN_LOG_EVERY_TICK", "true").strip().lower() == "true"
+GEN_DEBUG = env_flag("GEN_DEBUG", "true")
+GEN_LOG_EVERY_TICK = env_flag("GEN_LOG_EVERY_TICK", "true")
 
 # Soft structure override (USED ONLY WHEN USE_MA_FILTERS=false)
-STRUCT_SOFT_OVERRIDE = os.getenv("STRUCT_SOFT_OVERRIDE", "true").strip().lower() == "true"
+STRUCT_SOFT_OVERRIDE = env_flag("STRUCT_SOFT_OVERRIDE", "true")
 STRUCT_SOFT_MIN_TREND = float(os.getenv("STRUCT_SOFT_MIN_TREND", "0.58"))
 STRUCT_SOFT_MIN_MA_GAP = float(os.getenv("STRUCT_SOFT_MIN_MA_GAP", "0.35"))
 STRUCT_SOFT_REQUIRE_LAST_UP = int(os.getenv("STRUCT_SOFT_REQUIRE_LAST_UP", "2"))
@@ -58,14 +61,24 @@ EXCEL_MODEL_PATH = os.getenv("EXCEL_MODEL_PATH", "/var/data/DYZEN_CAPITAL_OS_AI_
 if EXCEL_MODEL_PATH.lower().startswith("excel_model_path="):
     EXCEL_MODEL_PATH = EXCEL_MODEL_PATH.split("=", 1)[1].strip()
 
-_last_emit_ts: float = 0.0
+# monotonic: immune to NTP/wall-clock jumps
+_next_emit_deadline: float = 0.0
+
+# signal ids: one random prefix per process + counter. executed ids persist in the DB,
+# so the prefix (not the pid, which repeats across container restarts) keeps them unique.
+_SIG_PREFIX = f"GBM-AUTO-{uuid.uuid4().hex[:12]}"
+_sig_counter = itertools.count()
 
 
 # -----------------------------
 # HELPERS
 # -----------------------------
 def _now_utc_iso() -> str:
-    return datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def _next_signal_id() -> str:
+    return f"{_SIG_PREFIX}-{next(_sig_counter):08x}"
 
 
 def _parse_symbols() -> List[str]:
@@ -87,20 +100,13 @@ def _parse_symbols() -> List[str]:
 SYMBOLS = _parse_symbols()
 
 
-def _has_active_oco(symbol: str) -> bool:
-    try:
-        return has_active_oco_for_symbol(symbol)
-    except Exception as e:
-        logger.warning(f"[GEN] ACTIVE_OCO_CHECK_FAIL | symbol={symbol} err={e} -> assume active_oco=True")
-        return True
-
-
-def _has_open_trade(symbol: str) -> bool:
+def _exposure(symbol: str) -> Tuple[bool, bool]:
+    """(open_trade, active_oco); on DB errors assume both so nothing new is opened."""
     try:
-        return has_open_trade_for_symbol(symbol)
+        return get_symbol_exposure(symbol)
     except Exception as e:
-        logger.warning(f"[GEN] OPEN_TRADE_CHECK_FAIL | symbol={symbol} err={e} -> assume open_trade=True")
-        return True
+        logger.warning("[GEN] EXPOSURE_CHECK_FAIL | symbol=%s err=%s -> assume open_trade=True active_oco=True", symbol, e)
+        return True, True
 
 
 def _resolve_excel_path(env_path: str) -> str:
@@ -135,10 +141,11 @@ def _core() -> ExcelLiveCore:
     if _CORE is None:
         resolved = _resolve_excel_path(EXCEL_MODEL_PATH)
         logger.info(
-            f"[GEN] EXCEL_PATH | env={EXCEL_MODEL_PATH} resolved={resolved} exists_env={os.path.exists(EXCEL_MODEL_PATH)}"
+            "[GEN] EXCEL_PATH | env=%s resolved=%s exists_env=%s",
+            EXCEL_MODEL_PATH, resolved, os.path.exists(EXCEL_MODEL_PATH),
         )
         _CORE = ExcelLiveCore(resolved)
-        logger.info(f"[GEN] EXCEL_CORE_LOADED | path={resolved}")
+        logger.info("[GEN] EXCEL_CORE_LOADED | path=%s", resolved)
     return _CORE
 
 
@@ -206,14 +213,13 @@ def _edge_ok(atr_pct: float) -> Tuple[bool, str]:
 
 
 def _cooldown_ok() -> bool:
-    global _last_emit_ts
-    return (time.time() - _last_emit_ts) >= COOLDOWN_SECONDS
+    return time.monotonic() >= _next_emit_deadline
 
 
 def _emit(signal: Dict[str, Any], outbox_path: str) -> None:
-    global _last_emit_ts
+    global _next_emit_deadline
     append_signal(signal, outbox_path)
-    _last_emit_ts = time.time()
+    _next_emit_deadline = time.monotonic() + COOLDOWN_SECONDS
 
 
 def _get_outbox_path() -> str:
@@ -264,17 +270,108 @@ def _build_exchange() -> ccxt.Exchange:
 
     api_key = os.getenv("BINANCE_API_KEY", "").strip()
     api_secret = os.getenv("BINANCE_API_SECRET", "").strip()
-    return ccxt.binance({
-        "enableRateLimit": True,
-        "apiKey": api_key,
-        "secret": api_secret,
-        "options": {"defaultType": market_type},
-    })
+    return shared_binance(api_key, api_secret, market_type=market_type)
 
 
 EXCHANGE = _build_exchange()
 
 
+# -----------------------------
+# CANDLE BUFFER
+# -----------------------------
+class _CandleBuffer:
+    """
+    Closed candles for one symbol. REST is only hit once a new candle can have
+    closed since the last refresh; every other tick reads the local buffer.
+    The 20-candle close/volume sums are rolled forward per appended candle.
+    """
+
+    def __init__(self, maxlen: int):
+        self.candles: Deque[List[float]] = deque(maxlen=maxlen)
+        self.closes: List[float] = []
+        self.vols: List[float] = []
+        self.dropped = False
+        self.next_close_ms = 0
+        self.features: Optional["_Features"] = None
+        self._close_win: Deque[float] = deque(maxlen=20)
+        self._vol_win: Deque[float] = deque(maxlen=20)
+        self._close_sum = 0.0
+        self._vol_sum = 0.0
+
+    def clear(self) -> None:
+        self.candles.clear()
+        self._close_win.clear()
+        self._vol_win.clear()
+        self._close_sum = 0.0
+        self._vol_sum = 0.0
+
+    def append(self, c: List[float]) -> None:
+        self.candles.append(c)
+        close = float(c[4])
+        vol = float(c[5])
+        if len(self._close_win) == 20:
+            self._close_sum -= self._close_win[0]
+            self._vol_sum -= self._vol_win[0]
+        self._close_win.append(close)
+        self._vol_win.append(vol)
+        self._close_sum += close
+        self._vol_sum += vol
+
+    def materialize(self) -> None:
+        # rebuilt only when candles were appended, not per tick
+        self.closes = [float(c[4]) for c in self.candles]
+        self.vols = [float(c[5]) for c in self.candles]
+        self.features = None
+
+    @property
+    def ma20(self) -> float:
+        n = len(self._close_win)
+        return self._close_sum / n if n else 0.0
+
+    @property
+    def vol_avg20(self) -> float:
+        return self._vol_sum / 20.0 if len(self._vol_win) == 20 else 0.0
+
+
+_CANDLES: Dict[str, _CandleBuffer] = {}
+
+
+def _candles(symbol: str) -> _CandleBuffer:
+    buf = _CANDLES.get(symbol)
+    if buf is None:
+        buf = _CANDLES[symbol] = _CandleBuffer(CANDLE_LIMIT)
+
+    now_ms = int(time.time() * 1000)
+    if buf.candles and now_ms < buf.next_close_ms:
+        return buf
+
+    tf_ms = _tf_seconds(TIMEFRAME) * 1000
+    last_ts = int(buf.candles[-1][0]) if buf.candles else 0
+
+    if buf.candles and (now_ms - last_ts) // tf_ms < CANDLE_LIMIT:
+        # incremental: only the candles after the newest one we already hold
+        fresh = EXCHANGE.fetch_ohlcv(symbol, timeframe=TIMEFRAME, since=last_ts + tf_ms, limit=CANDLE_LIMIT)
+    else:
+        buf.clear()
+        last_ts = 0
+        fresh = EXCHANGE.fetch_ohlcv(symbol, timeframe=TIMEFRAME, limit=CANDLE_LIMIT)
+
+    fresh, dropped = _drop_unclosed_candle(fresh or [], TIMEFRAME)
+    appended = False
+    for c in fresh:
+        if int(c[0]) > last_ts:
+            buf.append(c)
+            last_ts = int(c[0])
+            appended = True
+
+    if appended:
+        buf.materialize()
+    buf.dropped = dropped
+    # the candle opening after our newest closed one closes one timeframe later
+    buf.next_close_ms = last_ts + 2 * tf_ms if buf.candles else 0
+    return buf
+
+
 # -----------------------------
 # FEATURE CALCS
 # -----------------------------
@@ -307,7 +404,7 @@ def _ups_count(closes: List[float], n: int) -> int:
     return ups
 
 
-def _trend_strength(closes: List[float], use_ma: bool) -> float:
+def _trend_strength(closes: List[float], use_ma: bool, ma20: Optional[float] = None) -> float:
     if len(closes) < 20:
         return 0.0
 
@@ -324,14 +421,17 @@ def _trend_strength(closes: List[float], use_ma: bool) -> float:
     base += 0.20 * (ups3 / 3.0)
 
     if use_ma:
-        ma20 = _sma(closes, 20)
+        if ma20 is None:
+            ma20 = _sma(closes, 20)
         gap_pct = _pct(last, ma20)
         base += 0.15 * max(0.0, min(1.0, gap_pct / 0.6))
 
     return max(0.0, min(1.0, base))
 
 
-def _structure_ok(closes: List[float], use_ma: bool, trend_strength: float) -> Tuple[bool, str]:
+def _structure_ok(
+    closes: List[float], use_ma: bool, trend_strength: float, ma20: Optional[float] = None
+) -> Tuple[bool, str]:
     if len(closes) < 20:
         return False, "len<20"
 
@@ -348,7 +448,8 @@ def _structure_ok(closes: List[float], use_ma: bool, trend_strength: float) -> T
     c_mom10 = mom10 > -0.002
 
     if use_ma:
-        ma20 = _sma(closes, 20)
+        if ma20 is None:
+            ma20 = _sma(closes, 20)
         c_ma = last > ma20
         ok = c_last_prev and c_sma and c_ups and c_ma and c_mom10
         reason = (
@@ -392,11 +493,12 @@ def _structure_ok(closes: List[float], use_ma: bool, trend_strength: float) -> T
     return False, reason
 
 
-def _volume_score(vols: List[float]) -> Tuple[float, float]:
+def _volume_score(vols: List[float], v_avg: Optional[float] = None) -> Tuple[float, float]:
     if len(vols) < 20:
         return 0.0, 0.0
     v_last = vols[-1]
-    v_avg = sum(vols[-20:]) / 20.0
+    if v_avg is None:
+        v_avg = sum(vols[-20:]) / 20.0
     if v_avg <= 0:
         return 0.0, 0.0
     v_ratio = v_last / v_avg
@@ -404,7 +506,9 @@ def _volume_score(vols: List[float]) -> Tuple[float, float]:
     return score, v_ratio
 
 
-def _confidence_score(closes: List[float], ohlcv: List[List[float]], use_ma: bool) -> float:
+def _confidence_score(
+    closes: List[float], ohlcv: List[List[float]], use_ma: bool, ma20: Optional[float] = None
+) -> float:
     if len(closes) < 20 or len(ohlcv) < 20:
         return 0.0
 
@@ -418,13 +522,48 @@ def _confidence_score(closes: List[float], ohlcv: List[List[float]], use_ma: boo
     cond_slope = max(0.0, min(1.0, slope / 0.003))
 
     if use_ma:
-        ma20 = _sma(closes, 20)
+        if ma20 is None:
+            ma20 = _sma(closes, 20)
         cond_ma = 1.0 if last > ma20 else 0.0
         return (0.35 * cond_ma) + (0.35 * cond_last_prev) + (0.20 * cond_slope) + (0.10 * cond_atr)
 
     return (0.45 * cond_last_prev) + (0.35 * cond_slope) + (0.20 * cond_atr)
 
 
+class _Features(NamedTuple):
+    atrp: float
+    vol_reg: str
+    trend: float
+    struct_ok: bool
+    struct_reason: str
+    vol_score: float
+    v_ratio: float
+    conf: float
+
+
+def _features(buf: _CandleBuffer) -> _Features:
+    """
+    Indicator block for the buffer's closed candles. Inputs only change when a
+    candle closes, so the result is kept on the buffer until the next append.
+    """
+    f = buf.features
+    if f is not None:
+        return f
+
+    closes = buf.closes
+    ma20 = buf.ma20
+    atrp = _atr_pct(buf.candles, 14)
+    trend = _trend_strength(closes, USE_MA_FILTERS, ma20)
+    struct_ok, struct_reason = _structure_ok(closes, USE_MA_FILTERS, trend, ma20)
+    vol_score, v_ratio = _volume_score(buf.vols, buf.vol_avg20)
+    conf = _confidence_score(closes, buf.candles, USE_MA_FILTERS, ma20)
+
+    f = buf.features = _Features(
+        atrp, _vol_regime(atrp), trend, struct_ok, struct_reason, vol_score, v_ratio, conf
+    )
+    return f
+
+
 def _risk_state(vol_regime: str, ai_score: float) -> str:
     if vol_regime == "EXTREME":
         return "KILL"
@@ -442,38 +581,30 @@ def generate_signal() -> Optional[Dict[str, Any]]:
     core = _core()
 
     for symbol in SYMBOLS:
-        active_oco = _has_active_oco(symbol)
-        open_trade = _has_open_trade(symbol)
+        open_trade, active_oco = _exposure(symbol)
 
         try:
-            ohlcv = EXCHANGE.fetch_ohlcv(symbol, timeframe=TIMEFRAME, limit=CANDLE_LIMIT)
+            buf = _candles(symbol)
         except Exception as e:
-            logger.exception(f"[GEN] FETCH_FAIL | symbol={symbol} tf={TIMEFRAME} err={e}")
+            logger.exception("[GEN] FETCH_FAIL | symbol=%s tf=%s err=%s", symbol, TIMEFRAME, e)
             continue
 
-        if not ohlcv or len(ohlcv) < 30:
+        ohlcv = buf.candles
+        dropped = buf.dropped
+        if len(ohlcv) < 30:
             if GEN_LOG_EVERY_TICK:
                 logger.info(
-                    f"[GEN] NO_SIGNAL | symbol={symbol} reason=not_enough_candles got={len(ohlcv) if ohlcv else 0} need>=30"
+                    "[GEN] NO_SIGNAL | symbol=%s reason=not_enough_candles got=%d need>=30", symbol, len(ohlcv)
                 )
             continue
 
-        ohlcv, dropped = _drop_unclosed_candle(ohlcv, TIMEFRAME)
-        if len(ohlcv) < 30:
-            continue
-
-        closes = [float(c[4]) for c in ohlcv]
-        vols = [float(c[5]) for c in ohlcv]
+        closes = buf.closes
+        vols = buf.vols
+        ma20 = buf.ma20
 
         last = closes[-1]
         prev = closes[-2]
-        atrp = _atr_pct(ohlcv, 14)
-        vol_reg = _vol_regime(atrp)
-
-        trend = _trend_strength(closes, USE_MA_FILTERS)
-        struct_ok, struct_reason = _structure_ok(closes, USE_MA_FILTERS, trend)
-        vol_score, v_ratio = _volume_score(vols)
-        conf = _confidence_score(closes, ohlcv, USE_MA_FILTERS)
+        atrp, vol_reg, trend, struct_ok, struct_reason, vol_score, v_ratio, conf = _features(buf)
 
         tmp_inp = CoreInputs(
             trend_strength=trend,
@@ -497,12 +628,13 @@ def generate_signal() -> Optional[Dict[str, Any]]:
         )
         decision = core.decide(inp)
 
-        if GEN_DEBUG:
+        if GEN_DEBUG and logger.isEnabledFor(logging.INFO):
+            # the DIAG extras below are only computed for the log line
             logger.info(
-                f"[GEN] CORE_DECISION | symbol={symbol} ai={decision['ai_score']:.3f} macro={decision['macro_gate']} "
-                f"strat={decision['active_strategy']} final={decision['final_trade_decision']} risk={risk} "
-                f"volReg={vol_reg} atr%={atrp:.2f} last={last:.6f} prev={prev:.6f} "
-                f"dropped_last_candle={dropped} outbox={outbox_path}"
+                "[GEN] CORE_DECISION | symbol=%s ai=%.3f macro=%s strat=%s final=%s risk=%s "
+                "volReg=%s atr%%=%.2f last=%.6f prev=%.6f dropped_last_candle=%s outbox=%s",
+                symbol, decision["ai_score"], decision["macro_gate"], decision["active_strategy"],
+                decision["final_trade_decision"], risk, vol_reg, atrp, last, prev, dropped, outbox_path,
             )
 
             mom1 = _momentum(closes, 1)
@@ -510,33 +642,34 @@ def generate_signal() -> Optional[Dict[str, Any]]:
             slope = _slope_sma(closes)
             ups3 = _ups_count(closes, 3)
             v5 = sum(vols[-5:]) / 5.0 if len(vols) >= 5 else 0.0
-            v20 = sum(vols[-20:]) / 20.0 if len(vols) >= 20 else 0.0
+            v20 = buf.vol_avg20
             s5 = _sma(closes, 5)
             s10 = _sma(closes, 10)
 
             if USE_MA_FILTERS:
-                ma20 = _sma(closes, 20)
                 ma_gap_abs = abs(_pct(last, ma20))
                 logger.info(
-                    f"[GEN] DIAG | symbol={symbol} trend={trend:.3f} conf={conf:.3f} struct={struct_ok} "
-                    f"vol_score={vol_score:.3f} struct_reason={struct_reason} "
-                    f"mom1={mom1:.6f} mom10={mom10:.6f} slope={slope:.6f} ups3={ups3} "
-                    f"sma5={s5:.6f} sma10={s10:.6f} ma_gap%={ma_gap_abs:.3f} "
-                    f"v5={v5:.3f} v20={v20:.3f} vRatio={v_ratio:.3f} use_ma={USE_MA_FILTERS}"
+                    "[GEN] DIAG | symbol=%s trend=%.3f conf=%.3f struct=%s vol_score=%.3f struct_reason=%s "
+                    "mom1=%.6f mom10=%.6f slope=%.6f ups3=%s sma5=%.6f sma10=%.6f ma_gap%%=%.3f "
+                    "v5=%.3f v20=%.3f vRatio=%.3f use_ma=%s",
+                    symbol, trend, conf, struct_ok, vol_score, struct_reason,
+                    mom1, mom10, slope, ups3, s5, s10, ma_gap_abs,
+                    v5, v20, v_ratio, USE_MA_FILTERS,
                 )
             else:
                 sma_gap_pct = _pct(s5, s10) if s10 else 0.0
                 logger.info(
-                    f"[GEN] DIAG | symbol={symbol} trend={trend:.3f} conf={conf:.3f} struct={struct_ok} "
-                    f"vol_score={vol_score:.3f} struct_reason={struct_reason} "
-                    f"mom1={mom1:.6f} mom10={mom10:.6f} slope={slope:.6f} ups3={ups3} "
-                    f"sma5={s5:.6f} sma10={s10:.6f} sma_gap%={sma_gap_pct:.3f} "
-                    f"v5={v5:.3f} v20={v20:.3f} vRatio={v_ratio:.3f} use_ma={USE_MA_FILTERS}"
+                    "[GEN] DIAG | symbol=%s trend=%.3f conf=%.3f struct=%s vol_score=%.3f struct_reason=%s "
+                    "mom1=%.6f mom10=%.6f slope=%.6f ups3=%s sma5=%.6f sma10=%.6f sma_gap%%=%.3f "
+                    "v5=%.3f v20=%.3f vRatio=%.3f use_ma=%s",
+                    symbol, trend, conf, struct_ok, vol_score, struct_reason,
+                    mom1, mom10, slope, ups3, s5, s10, sma_gap_pct,
+                    v5, v20, v_ratio, USE_MA_FILTERS,
                 )
 
         # Protective SELL if active OCO and risk is KILL
         if active_oco and risk == "KILL":
-            signal_id = str(uuid.uuid4())
+            signal_id = _next_signal_id()
             sig = {
                 "signal_id": signal_id,
                 "ts_utc": _now_utc_iso(),
@@ -559,12 +692,12 @@ def generate_signal() -> Optional[Dict[str, Any]]:
 
         if open_trade:
             if GEN_DEBUG:
-                logger.info(f"[GEN] BLOCKED_BY_OPEN_TRADE | symbol={symbol}")
+                logger.info("[GEN] BLOCKED_BY_OPEN_TRADE | symbol=%s", symbol)
             continue
 
         if active_oco and BLOCK_SIGNALS_WHEN_ACTIVE_OCO:
             if GEN_DEBUG:
-                logger.info(f"[GEN] BLOCKED_BY_ACTIVE_OCO | symbol={symbol}")
+                logger.info("[GEN] BLOCKED_BY_ACTIVE_OCO | symbol=%s", symbol)
             continue
 
         if decision["final_trade_decision"] != "EXECUTE":
@@ -574,34 +707,35 @@ def generate_signal() -> Optional[Dict[str, Any]]:
         # EXTRA LIVE GUARDS
         # -----------------------------
         if USE_MA_FILTERS:
-            ma20 = _sma(closes, 20)
             ma_gap_abs = abs(_pct(last, ma20))
             if ma_gap_abs < MA_GAP_PCT:
                 if GEN_DEBUG:
                     logger.info(
-                        f"[GEN] BLOCKED_BY_MA_GAP | symbol={symbol} gap%={ma_gap_abs:.3f} < MA_GAP_PCT={MA_GAP_PCT:.3f}"
+                        "[GEN] BLOCKED_BY_MA_GAP | symbol=%s gap%%=%.3f < MA_GAP_PCT=%.3f",
+                        symbol, ma_gap_abs, MA_GAP_PCT,
                     )
                 continue
 
         if conf < BUY_CONFIDENCE_MIN:
             if GEN_DEBUG:
                 logger.info(
-                    f"[GEN] BLOCKED_BY_CONF | symbol={symbol} conf={conf:.3f} < BUY_CONFIDENCE_MIN={BUY_CONFIDENCE_MIN:.3f}"
+                    "[GEN] BLOCKED_BY_CONF | symbol=%s conf=%.3f < BUY_CONFIDENCE_MIN=%.3f",
+                    symbol, conf, BUY_CONFIDENCE_MIN,
                 )
             continue
 
         ok_edge, edge_reason = _edge_ok(atrp)
         if not ok_edge:
             if GEN_DEBUG:
-                logger.info(f"[GEN] BLOCKED_BY_EDGE | symbol={symbol} reason={edge_reason}")
+                logger.info("[GEN] BLOCKED_BY_EDGE | symbol=%s reason=%s", symbol, edge_reason)
             continue
 
         if not ALLOW_LIVE_SIGNALS:
             if GEN_DEBUG:
-                logger.info(f"[GEN] BLOCKED_BY_ENV | symbol={symbol} reason=ALLOW_LIVE_SIGNALS=false")
+                logger.info("[GEN] BLOCKED_BY_ENV | symbol=%s reason=ALLOW_LIVE_SIGNALS=false", symbol)
             continue
 
-        signal_id = str(uuid.uuid4())
+        signal_id = _next_signal_id()
         sig = {
             "signal_id": signal_id,
             "ts_utc": _now_utc_iso(),
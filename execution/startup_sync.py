@@ -1,11 +1,32 @@
 # execution/startup_sync.py
 import os
+import time
+import random
 import logging
 
+from execution._common import LIVE_MODES
 from execution.db.repository import update_system_state, log_event
+from execution.exchange_client import make_exchange_client
 
 logger = logging.getLogger("gbm")
 
+# a transient exchange error at boot should not PAUSE the system on the first try
+_RETRIES = max(0, int(os.getenv("STARTUP_SYNC_RETRIES", "3")))
+_BACKOFF_SEC = float(os.getenv("STARTUP_SYNC_BACKOFF_SEC", "0.5"))
+
+
+def _diagnostics_with_retry(ex) -> dict:
+    """ex.diagnostics(), retried with exponential backoff + jitter while the failure is transient."""
+    diag = ex.diagnostics()
+    for attempt in range(_RETRIES):
+        if diag.get("ok") or not diag.get("transient"):
+            break
+        delay = _BACKOFF_SEC * (2 ** attempt) + random.uniform(0.0, _BACKOFF_SEC / 4)
+        logger.warning("STARTUP_SYNC: transient exchange error, retry %s/%s in %.2fs | err=%s", attempt + 1, _RETRIES, delay, diag.get("error"))
+        time.sleep(delay)
+        diag = ex.diagnostics()
+    return diag
+
 
 def run_startup_sync() -> bool:
     """
@@ -17,20 +38,18 @@ def run_startup_sync() -> bool:
     mode = os.getenv("MODE", "DEMO").upper()
 
     try:
-        if mode in ("LIVE", "TESTNET"):
-            from execution.exchange_client import BinanceSpotClient
-
-            ex = BinanceSpotClient()
-            diag = ex.diagnostics()
+        if mode in LIVE_MODES:
+            ex = make_exchange_client(mode)
+            diag = _diagnostics_with_retry(ex)
 
             if not diag.get("ok"):
                 err = diag.get("error", "unknown")
-                logger.warning(f"STARTUP_SYNC: {mode} -> EXCHANGE_CONNECT_FAILED -> PAUSE | err={err}")
+                logger.warning("STARTUP_SYNC: %s -> EXCHANGE_CONNECT_FAILED -> PAUSE | err=%s", mode, err)
                 update_system_state(status="PAUSED", startup_sync_ok=False)
                 log_event("STARTUP_SYNC_FAILED", f"{mode} exchange_connect_failed err={err}")
                 return False
 
-            logger.info(f"STARTUP_SYNC: {mode} -> EXCHANGE_OK | usdt_free={diag.get('usdt_free')} last={diag.get('last_price')}")
+            logger.info("STARTUP_SYNC: %s -> EXCHANGE_OK | usdt_free=%s last=%s", mode, diag.get("usdt_free"), diag.get("last_price"))
             update_system_state(status="ACTIVE", startup_sync_ok=True)
             log_event("STARTUP_SYNC_OK", f"{mode} exchange_ok usdt_free={diag.get('usdt_free')}")
             return True
@@ -41,7 +60,7 @@ def run_startup_sync() -> bool:
         return True
 
     except Exception as e:
-        logger.warning(f"STARTUP_SYNC: ERROR -> PAUSE | err={e}")
+        logger.warning("STARTUP_SYNC: ERROR -> PAUSE | err=%s", e)
         update_system_state(status="PAUSED", startup_sync_ok=False)
         log_event("STARTUP_SYNC_FAILED", f"{mode} err={e}")
         return False
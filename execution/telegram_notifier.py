@@ -1,19 +1,17 @@
 import os
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any, Dict, Optional, List
 from zoneinfo import ZoneInfo
 
 import requests
 
-logger = logging.getLogger("gbm")
-
+from execution._common import env_flag
 
-def _env_bool(name: str, default: str = "false") -> bool:
-    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "y", "on")
+logger = logging.getLogger("gbm")
 
 
-TELEGRAM_ENABLED = _env_bool("TELEGRAM_NOTIFICATIONS", "false")
+TELEGRAM_ENABLED = env_flag("TELEGRAM_NOTIFICATIONS", "false")
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "").strip()
 TELEGRAM_CHAT_IDS = [
     x.strip()
@@ -0,0 +1,10 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# execution.config reads DB_PATH at import time: point it at a throwaway file first
+os.environ.setdefault("DB_PATH", str(Path(tempfile.mkdtemp(prefix="gbm-tests-")) / "genius_bot.db"))
+os.environ.setdefault("MODE", "DEMO")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,86 @@
+import random
+from decimal import ROUND_FLOOR, Decimal
+
+import pytest
+
+from execution.exchange_client import BinanceSpotClient, SymbolParams, _floor_to_step, _step_scale
+
+STEPS = ["0.00001000", "0.01", "10", "0.00000001"]
+NOISY = [0.00018, 76253.9, 0.29, 0.1 + 0.2, 1.0, 19.99, 0.58, 1.15, 4.35, 1e-5, 0.0]
+
+
+def _decimal_floor(value: float, step: str) -> float:
+    d, s = Decimal(str(value)), Decimal(step)
+    return float((d / s).to_integral_value(rounding=ROUND_FLOOR) * s)
+
+
+def _floor(value: float, step: str) -> float:
+    scale, units, _ = _step_scale(step)
+    return _floor_to_step(value, scale, units)
+
+
+@pytest.mark.parametrize(
+    "step, expected",
+    [
+        ("0.00001000", (100000, 1, 5)),
+        ("0.01", (100, 1, 2)),
+        ("0.01000000", (100, 1, 2)),
+        ("10", (1, 10, 0)),
+        ("10.00000000", (1, 10, 0)),
+        ("0.00000001", (100000000, 1, 8)),
+        ("0.5", (10, 5, 1)),
+    ],
+)
+def test_step_scale(step, expected):
+    assert _step_scale(step) == expected
+
+
+@pytest.mark.parametrize("step", STEPS)
+@pytest.mark.parametrize("value", NOISY)
+def test_floor_matches_decimal_on_noisy_inputs(step, value):
+    assert _floor(value, step) == _decimal_floor(value, step)
+
+
+@pytest.mark.parametrize("step", STEPS + ["0.5", "0.00010000"])
+def test_floor_matches_decimal_on_step_multiples(step):
+    # exact multiples of the step must never lose a step to float noise
+    s = Decimal(step)
+    for k in list(range(0, 2000)) + [10**6 + 7, 123456789, 2100000000000]:
+        value = float(s * k)
+        assert _floor(value, step) == _decimal_floor(value, step), value
+
+
+def test_floor_matches_decimal_for_large_amounts_at_1e8():
+    rng = random.Random(1234)
+    step = "0.00000001"
+    for _ in range(20000):
+        value = round(rng.uniform(0, 50_000_000), rng.randint(0, 8))
+        assert _floor(value, step) == _decimal_floor(value, step), value
+    for value in (12345.67891234, 98765432.1, 21000000.0, 1234567.89012345, 99999999.99999999):
+        assert _floor(value, step) == _decimal_floor(value, step), value
+
+
+def _client(amount_step: str, price_step: str) -> BinanceSpotClient:
+    c = BinanceSpotClient.__new__(BinanceSpotClient)
+    c._sym_cache = {
+        "BTC/USDT": SymbolParams(5.0, True, *_step_scale(amount_step), *_step_scale(price_step)),
+    }
+    return c
+
+
+def test_client_floors_amounts_and_prices():
+    c = _client("0.00001000", "0.01000000")
+    assert c.floor_amount("BTC/USDT", 0.00018) == 0.00018
+    assert c.floor_amount("BTC/USDT", 0.000189999) == 0.00018
+    assert c.floor_price("BTC/USDT", 76253.9) == 76253.9
+    # flooring, not rounding: a TP/SL price never moves up a tick
+    assert c.floor_price("BTC/USDT", 76253.999) == 76253.99
+    assert c.floor_prices("BTC/USDT", 0.29, 101.299, 99.155) == (0.29, 101.29, 99.15)
+    assert c._amount_str("BTC/USDT", 0.00018) == "0.00018"
+    assert c._price_str("BTC/USDT", 76253.9) == "76253.90"
+
+
+def test_client_floors_to_multi_unit_step():
+    c = _client("10", "0.01")
+    assert c.floor_amount("BTC/USDT", 129.99) == 120.0
+    assert c._amount_str("BTC/USDT", 130.0) == "130"
@@ -0,0 +1,207 @@
+from types import SimpleNamespace
+
+import pytest
+
+from execution import execution_engine as ee
+from execution.db import repository as repo
+from execution.db.db import init_db
+
+PAYLOAD = {"symbol": "BTC/USDT", "direction": "LONG", "entry": {"type": "MARKET"}, "quote_amount": 15}
+
+
+class _Ticker:
+    def fetch_ticker(self, symbol):
+        return {"last": 100.0}
+
+    def fetch_order_book(self, symbol, limit=5):
+        return {"bids": [[100.0, 1.0]], "asks": [[100.01, 1.0]]}
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    init_db()
+    with repo.cursor() as cur:
+        cur.execute("DELETE FROM executed_signals")
+    repo._executed_ids.clear()
+    repo._pending_claims.clear()
+    repo.update_system_state(status="ACTIVE", startup_sync_ok=1, kill_switch=0)
+
+    events = []
+    entries = []
+    monkeypatch.setattr(ee, "log_event", lambda event_type, message="": events.append(event_type))
+    monkeypatch.setattr(ee, "simulate_market_entry", lambda **kw: entries.append(kw) or {"status": "FILLED"})
+
+    e = ee.ExecutionEngine()
+    assert e.mode == "DEMO"
+    e.price_feed = _Ticker()
+    return SimpleNamespace(engine=e, run=e.execute_signal, events=events, entries=entries)
+
+
+def _signal(signal_id, verdict, **execution):
+    return {
+        "signal_id": signal_id,
+        "final_verdict": verdict,
+        "certified_signal": True,
+        "execution": dict(PAYLOAD, **execution),
+    }
+
+
+def _action(signal_id):
+    row = repo._fetchone("SELECT action FROM executed_signals WHERE signal_id = ?", (signal_id,))
+    return row[0] if row else None
+
+
+def test_trade_runs_demo_entry(engine):
+    engine.run(_signal("t1", "TRADE"))
+    assert engine.events == ["TRADE_EXECUTED"]
+    assert len(engine.entries) == 1
+    assert _action("t1") == "TRADE_DEMO"
+
+
+def test_hold_is_marked_without_an_entry(engine):
+    engine.run(_signal("h1", "HOLD"))
+    assert engine.events == ["EXEC_HOLD"]
+    assert engine.entries == []
+    assert _action("h1") == "HOLD"
+
+    # a replayed HOLD is deduped like any executed id
+    engine.run(_signal("h1", "HOLD"))
+    assert engine.events[-1] == "EXEC_DEDUPED"
+
+
+@pytest.mark.parametrize("verdict", ["FOO", "", "BUY"])
+def test_unsupported_verdict_is_rejected_unclaimed(engine, verdict):
+    engine.run(_signal("u1", verdict))
+    assert engine.events == ["REJECT_UNSUPPORTED_VERDICT"]
+    assert engine.entries == []
+    assert _action("u1") is None
+    assert repo.signal_id_already_executed("u1") is False
+
+
+@pytest.mark.parametrize(
+    "verdict, execution, event",
+    [
+        ("TRADE", {"symbol": ""}, "REJECT_BAD_PAYLOAD"),
+        ("TRADE", {"direction": "SHORT"}, "REJECT_BAD_PAYLOAD"),
+        ("TRADE", {"entry": {"type": "LIMIT"}}, "REJECT_BAD_PAYLOAD"),
+        ("TRADE", {"quote_amount": None}, "REJECT_BAD_PAYLOAD"),
+        ("TRADE", {"quote_amount": -5}, "REJECT_BAD_PAYLOAD"),
+        ("SELL", {"symbol": ""}, "REJECT_BAD_SELL_PAYLOAD"),
+        ("SELL", {"direction": "SHORT"}, "REJECT_BAD_SELL_PAYLOAD"),
+    ],
+)
+def test_bad_payload_is_rejected_unclaimed(engine, verdict, execution, event):
+    engine.run(_signal("b1", verdict, **execution))
+    assert engine.events == [event]
+    assert engine.entries == []
+    assert _action("b1") is None
+    assert repo.signal_id_already_executed("b1") is False
+
+
+# -----------------------------
+# OCO response parsing
+# -----------------------------
+@pytest.mark.parametrize("key", ["orderReports", "orders"])
+@pytest.mark.parametrize("tp_type", sorted(ee._TP_TYPES))
+@pytest.mark.parametrize("sl_type", sorted(ee._SL_TYPES))
+def test_oco_leg_ids_by_type(key, tp_type, sl_type):
+    raw = {key: [{"orderId": 12, "type": sl_type}, {"orderId": 11, "type": tp_type.lower()}]}
+    assert ee._oco_leg_ids(raw) == ("11", "12")
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        # real Binance reply: both lists, only the reports carry types
+        (
+            {
+                "orderListId": 7,
+                "orders": [{"symbol": "BTCUSDT", "orderId": 11}, {"symbol": "BTCUSDT", "orderId": 12}],
+                "orderReports": [
+                    {"orderId": 12, "type": "STOP_LOSS_LIMIT"},
+                    {"orderId": 11, "type": "LIMIT_MAKER"},
+                ],
+            },
+            ("11", "12"),
+        ),
+        # reports win over a typed orders list; the first leg of each kind is kept
+        (
+            {
+                "orderReports": [{"orderId": 1, "type": "LIMIT_MAKER"}, {"orderId": 2, "type": "STOP_LOSS_LIMIT"}],
+                "orders": [{"orderId": 3, "type": "LIMIT_MAKER"}, {"orderId": 4, "type": "STOP_LOSS_LIMIT"}],
+            },
+            ("1", "2"),
+        ),
+        # a leg missing from the reports is taken from orders
+        (
+            {
+                "orderReports": [{"orderId": 1, "type": "LIMIT_MAKER"}],
+                "orders": [{"orderId": 1, "type": "LIMIT_MAKER"}, {"orderId": 2, "type": "STOP_LOSS_LIMIT"}],
+            },
+            ("1", "2"),
+        ),
+        # untyped orders, unknown types and legs without an id bind nothing
+        ({"orders": [{"orderId": 1}, {"orderId": 2}]}, ("", "")),
+        ({"orderReports": [{"orderId": 1, "type": "MARKET"}, {"orderId": 0, "type": "STOP_LOSS_LIMIT"}]}, ("", "")),
+        ({"orderReports": None, "orders": None}, ("", "")),
+        ({}, ("", "")),
+    ],
+)
+def test_oco_leg_ids_from_response(raw, expected):
+    assert ee._oco_leg_ids(raw) == expected
+
+
+# -----------------------------
+# market fill price
+# -----------------------------
+@pytest.mark.parametrize(
+    "order, expected",
+    [
+        ({"average": 101.5, "price": 99.0, "cost": 1.0, "filled": 1.0}, 101.5),
+        ({"average": None, "price": 99.0}, 99.0),
+        ({"average": 0, "price": "99.5"}, 99.5),
+        ({"cost": 15.0, "filled": 0.15}, 100.0),
+        ({"cost": "15.0", "filled": "0.15", "price": None}, 100.0),
+        # raw Binance fills: VWAP of price weighted by qty
+        ({"filled": 0, "info": {"fills": [{"price": "100", "qty": "0.1"}, {"price": "103", "qty": "0.2"}]}}, 102.0),
+        # ccxt trades, used when the raw fills are absent
+        ({"trades": [{"price": 100.0, "amount": 3.0}, {"price": 104.0, "amount": 1.0}]}, 101.0),
+        ({"info": {"fills": []}, "trades": [{"price": 100.0, "amount": 1.0}]}, 100.0),
+        ({"info": {"fills": [{"price": "100", "qty": "0"}]}}, 0.0),
+        ({"average": None, "price": None, "cost": None, "filled": None, "info": {}}, 0.0),
+        ({}, 0.0),
+    ],
+)
+def test_fill_price(order, expected):
+    assert ee._fill_price(order) == pytest.approx(expected)
+
+
+class _Exchange:
+    def __init__(self, order):
+        self.order = order
+        self.last_price_calls = 0
+
+    def place_market_buy_by_quote(self, symbol, quote_amount):
+        return self.order
+
+    def fetch_last_price(self, symbol):
+        self.last_price_calls += 1
+        return 123.0
+
+
+@pytest.mark.parametrize(
+    "order, expected, rest_calls",
+    [
+        ({"id": "b1", "average": 101.5}, 101.5, 0),
+        ({"id": "b1", "cost": 15.0, "filled": 0.15}, 100.0, 0),
+        ({"id": "b1", "info": {"fills": [{"price": "100", "qty": "0.1"}, {"price": "103", "qty": "0.2"}]}}, 102.0, 0),
+        ({"id": "b1", "status": "closed"}, 123.0, 1),
+    ],
+)
+def test_entry_buy_price_falls_back_to_last_price(engine, order, expected, rest_calls):
+    fx = _Exchange(order)
+    engine.engine.exchange = fx
+    buy, avg = engine.engine._place_entry_buy("BTC/USDT", 15.0)
+    assert buy is order
+    assert avg == pytest.approx(expected)
+    assert fx.last_price_calls == rest_calls
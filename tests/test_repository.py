@@ -0,0 +1,63 @@
+import pytest
+
+from execution.db.db import init_db
+from execution.db import repository as repo
+
+
+@pytest.fixture(autouse=True)
+def fresh_db():
+    init_db()
+    with repo.cursor() as cur:
+        cur.execute("DELETE FROM executed_signals")
+    repo._executed_ids.clear()
+    repo._pending_claims.clear()
+    yield
+
+
+def _action(signal_id):
+    return repo._fetchone("SELECT action FROM executed_signals WHERE signal_id = ?", (signal_id,))
+
+
+def test_first_claim_wins():
+    assert repo.claim_signal_id("s1", symbol="BTC/USDT") is True
+    assert _action("s1") == ("CLAIMED",)
+
+
+def test_duplicate_claim_is_rejected():
+    assert repo.claim_signal_id("s1") is True
+    assert repo.claim_signal_id("s1") is False
+
+
+def test_duplicate_claim_is_rejected_without_lru():
+    # another worker: the row is there but this process never saw the id
+    assert repo.claim_signal_id("s1") is True
+    repo._executed_ids.clear()
+    assert repo.claim_signal_id("s1") is False
+
+
+def test_claim_then_terminal_mark():
+    assert repo.claim_signal_id("s1") is True
+    repo.mark_signal_id_executed("s1", action="TRADE_LIVE_BUY", symbol="BTC/USDT")
+    assert _action("s1") == ("TRADE_LIVE_BUY",)
+    assert repo.signal_id_already_executed("s1") is True
+    # terminal: nothing left to release, the id stays executed
+    assert repo.release_signal_claim("s1") is False
+    assert repo.claim_signal_id("s1") is False
+
+
+def test_released_claim_can_run_again():
+    assert repo.claim_signal_id("s1") is True
+    assert repo.release_signal_claim("s1") is True
+    assert _action("s1") is None
+    assert repo.signal_id_already_executed("s1") is False
+    assert repo.claim_signal_id("s1") is True
+
+
+def test_release_ignores_claims_held_elsewhere():
+    # lost the race: the CLAIMED row belongs to another worker and must survive
+    assert repo.claim_signal_id("s1") is True
+    repo._pending_claims.clear()
+    repo._executed_ids.clear()
+    assert repo.claim_signal_id("s1") is False
+    assert repo.release_signal_claim("s1") is False
+    assert _action("s1") == ("CLAIMED",)
@@ -0,0 +1,36 @@
+import pytest
+
+from execution.signal_generator import _CandleBuffer, _sma
+
+
+def _candle(i):
+    close = 100.0 + (i * 7 % 13) - 0.25 * i
+    vol = 10.0 + (i * 5 % 11)
+    return [i * 60_000, close, close + 1.0, close - 1.0, close, vol]
+
+
+@pytest.mark.parametrize("count", [1, 5, 19, 20, 21, 60, 200])
+def test_rolling_windows_match_sma(count):
+    buf = _CandleBuffer(maxlen=80)
+    for i in range(count):
+        buf.append(_candle(i))
+    buf.materialize()
+
+    assert buf.ma20 == pytest.approx(_sma(buf.closes, 20))
+    if len(buf.vols) >= 20:
+        assert buf.vol_avg20 == pytest.approx(_sma(buf.vols, 20))
+    else:
+        assert buf.vol_avg20 == 0.0
+
+
+def test_rolling_windows_after_clear():
+    buf = _CandleBuffer(maxlen=80)
+    for i in range(50):
+        buf.append(_candle(i))
+    buf.clear()
+    for i in range(100, 125):
+        buf.append(_candle(i))
+    buf.materialize()
+
+    assert buf.ma20 == pytest.approx(_sma(buf.closes, 20))
+    assert buf.vol_avg20 == pytest.approx(_sma(buf.vols, 20))
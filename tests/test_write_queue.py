@@ -0,0 +1,40 @@
+from execution.db import db
+from execution.db.db import cursor, init_db
+from execution.db.write_queue import WriteQueue
+
+
+def _rows():
+    with cursor() as cur:
+        cur.execute("SELECT v FROM wq_test ORDER BY v")
+        return [v for (v,) in cur.fetchall()]
+
+
+def test_writer_survives_failed_reconnect(tmp_path, monkeypatch):
+    init_db()
+    with cursor() as cur:
+        cur.execute("CREATE TABLE IF NOT EXISTS wq_test (v INTEGER)")
+        cur.execute("DELETE FROM wq_test")
+
+    q = WriteQueue(linger_sec=0.0)
+
+    # non-integrity sqlite error: the writer drops its connection
+    q.submit("INSERT INTO wq_missing_table (v) VALUES (?)", (0,))
+    q.join()
+    assert q.dropped == 1
+
+    # the reconnect fails: DB_PATH's parent cannot be created
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setattr(db, "DB_PATH", blocker / "genius_bot.db")
+    q.submit("INSERT INTO wq_test (v) VALUES (?)", (1,))
+    q.join()
+    assert q.dropped == 2
+
+    monkeypatch.undo()
+    q.submit("INSERT INTO wq_test (v) VALUES (?)", (2,))
+    q.join()
+
+    assert q._thread.is_alive()
+    assert q._q.unfinished_tasks == 0
+    assert q.dropped == 2
+    assert _rows() == [2]